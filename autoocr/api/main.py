@@ -12,6 +12,7 @@ For now we expose:
 
 We keep code minimal initially so we can layer modules incrementally.
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, UploadFile, File, HTTPException, Query
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
@@ -31,7 +32,14 @@ logger = get_logger("api")
 
 pipeline = Pipeline()
 
-app = FastAPI(title="AutoOCR Preprocessing API", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(_app):
+    # Warm lazy imports/models so the first request doesn't pay the cold-start cost
+    pipeline.warmup()
+    yield
+
+app = FastAPI(title="AutoOCR Preprocessing API", version="0.1.0", lifespan=lifespan)
 
 # CORS (allow all for development; tighten in production)
 app.add_middleware(
@@ -78,7 +86,7 @@ async def process_document(
         try:
             pages = pdf_to_images(data)
         except Exception as e:  # pylint: disable=broad-except
-            logger.error(f"pdf_conversion_failed error={e}")
+            logger.error("pdf_conversion_failed error=%s", e)
             raise HTTPException(status_code=500, detail=f"PDF conversion failed: {e}") from e
     else:
         # Single image
@@ -139,7 +147,7 @@ async def process_document(
 
     applied_count = sum(sum(1 for s in r["steps"] if s["applied"]) for r in results)
     metrics.inc_request(len(pages), applied_count)
-    logger.info(f"processed filename={file.filename} pages={len(pages)} modules_applied={applied_count}")
+    logger.info("processed filename=%s pages=%d modules_applied=%d", file.filename, len(pages), applied_count)
 
     # Always generate PDF bytes if caller wants a PDF (even for json/both so we can embed)
     if return_pdf:
@@ -9,7 +9,7 @@ from __future__ import annotations
 from typing import Tuple, Dict, Any
 import cv2
 import numpy as np
-from .base_module import BaseModule
+from .base_module import BaseModule, to_gray
 
 
 class ArtifactRemovalModule(BaseModule):
@@ -19,7 +19,7 @@ class ArtifactRemovalModule(BaseModule):
 
     def detect(self, image) -> Tuple[bool, Dict[str, Any]]:
         """Detect fold marks, tape, and pattern artifacts."""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        gray = to_gray(image)
 
         # Detect fold marks (lines)
         edges = cv2.Canny(gray, 50, 150)
@@ -64,7 +64,7 @@ class ArtifactRemovalModule(BaseModule):
     def process(self, image, detect_meta: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
         """Remove fold marks, tape, and patterns."""
         result = image.copy()
-        gray = cv2.cvtColor(result, cv2.COLOR_BGR2GRAY) if len(result.shape) == 3 else result
+        gray = to_gray(image)
 
         # Step 1: Fold Mark Removal
         if detect_meta.get("fold_marks_detected"):
@@ -9,7 +9,7 @@ from __future__ import annotations
 from typing import Tuple, Dict, Any
 import cv2
 import numpy as np
-from .base_module import BaseModule
+from .base_module import BaseModule, to_gray
 
 
 class BackgroundCleanModule(BaseModule):
@@ -19,7 +19,7 @@ class BackgroundCleanModule(BaseModule):
 
     def detect(self, image) -> Tuple[bool, Dict[str, Any]]:
         """Detect shadows, uneven lighting, and bleed-through."""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        gray = to_gray(image)
 
         # Detect shadows using low brightness regions
         shadow_mask = gray < 50
@@ -57,7 +57,7 @@ class BackgroundCleanModule(BaseModule):
     def process(self, image, detect_meta: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
         """Remove shadows, fix lighting, and remove bleed-through."""
         result = image.copy()
-        gray = cv2.cvtColor(result, cv2.COLOR_BGR2GRAY) if len(result.shape) == 3 else result
+        gray = to_gray(image)
 
         # Step 1: Uneven Lighting Correction (do first)
         if detect_meta.get("has_uneven_lighting"):
@@ -110,7 +110,7 @@ class BackgroundCleanModule(BaseModule):
 
     def _remove_shadows(self, image):
         """Remove dark shadows and folds."""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        gray = to_gray(image)
 
         # Morphological opening to remove dark spots
         kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (21, 21))
@@ -133,7 +133,7 @@ class BackgroundCleanModule(BaseModule):
 
     def _remove_bleed_through(self, image):
         """Remove bleed-through text from backside."""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        gray = to_gray(image)
 
         # Apply Sauvola binarization to separate foreground text
         from .binarize import BinarizeModule
@@ -10,10 +10,53 @@ Return conventions:
 - process(image, detect_meta) -> (image, dict)
 
 Images are assumed BGR (OpenCV default) unless otherwise noted.
+Use `to_gray(image)` instead of calling cvtColor directly so the grayscale
+conversion is shared across modules for the same page state.
 """
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Optional
+
+import cv2
+import numpy as np
+
+
+class PageImage(np.ndarray):
+    """BGR page array (zero-copy view) that memoizes its grayscale conversion.
+
+    The pipeline wraps the working image before each module and re-wraps it after
+    every `process`, so the cache never outlives the pixels it was computed from.
+    The cached gray is read-only because it is shared between modules.
+    """
+
+    _gray: Optional[np.ndarray] = None  # class default: new views start uncached
+
+    @classmethod
+    def wrap(cls, image) -> "PageImage":
+        return np.asarray(image).view(cls)
+
+    def __array_wrap__(self, array, context=None, return_scalar=False):
+        # Arithmetic/reductions on a page yield plain arrays and Python-compatible scalars
+        array = array.view(np.ndarray)
+        return array[()] if array.ndim == 0 else array
+
+    @property
+    def gray(self) -> np.ndarray:
+        if self._gray is None:
+            gray = cv2.cvtColor(self.view(np.ndarray), cv2.COLOR_BGR2GRAY)
+            gray.flags.writeable = False
+            self._gray = gray
+        return self._gray
+
+
+def to_gray(image) -> np.ndarray:
+    """Grayscale view of a BGR (or already single-channel) image; cached for PageImage inputs."""
+    if image.ndim == 2:
+        return image
+    if isinstance(image, PageImage):
+        return image.gray
+    return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
 
 class BaseModule(ABC):
     name: str = "base"
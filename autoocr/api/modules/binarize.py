@@ -12,19 +12,19 @@ import cv2
 import numpy as np
 from ..utils import config
 
-from .base_module import BaseModule
+from .base_module import BaseModule, to_gray
 
 class BinarizeModule(BaseModule):
     name = "binarize"
 
     def detect(self, image) -> Tuple[bool, Dict[str, Any]]:
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = to_gray(image)
         contrast = float(np.std(gray))
         # Always apply but record contrast for downstream analysis
         return True, {"pre_binarize_contrast": contrast}
 
     def process(self, image, detect_meta: Dict[str, Any]):
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = to_gray(image)
         # Try Sauvola (Skimage) fallback to OpenCV adaptive if unavailable
         try:
             from skimage.filters import threshold_sauvola  # local import to keep startup light
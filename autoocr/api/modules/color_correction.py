@@ -82,28 +82,15 @@ class ColorCorrectionModule(BaseModule):
 
     def _fix_white_balance(self, image):
         """Fix white balance using gray world assumption."""
-        # Convert to float
-        img_float = image.astype(np.float32) / 255.0
-
         # Calculate mean of each channel
-        b_mean = np.mean(img_float[:, :, 0])
-        g_mean = np.mean(img_float[:, :, 1])
-        r_mean = np.mean(img_float[:, :, 2])
+        b_mean, g_mean, r_mean = cv2.mean(image)[:3]
 
         # Calculate gray value
         gray_value = (b_mean + g_mean + r_mean) / 3
 
-        # Normalize channels
-        if b_mean > 0:
-            img_float[:, :, 0] = img_float[:, :, 0] * (gray_value / b_mean)
-        if g_mean > 0:
-            img_float[:, :, 1] = img_float[:, :, 1] * (gray_value / g_mean)
-        if r_mean > 0:
-            img_float[:, :, 2] = img_float[:, :, 2] * (gray_value / r_mean)
-
-        # Clip and convert back
-        img_float = np.clip(img_float, 0, 1)
-        result = (img_float * 255).astype(np.uint8)
+        # Per-channel gains applied as a diagonal color transform; stays uint8 (saturating)
+        gains = [gray_value / m if m > 0 else 1.0 for m in (b_mean, g_mean, r_mean)]
+        result = cv2.transform(image, np.diag(gains))
 
         return result
 
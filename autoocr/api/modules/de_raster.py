@@ -9,7 +9,7 @@ from __future__ import annotations
 from typing import Tuple, Dict, Any
 import cv2
 import numpy as np
-from .base_module import BaseModule
+from .base_module import BaseModule, to_gray
 
 
 class DeRasterModule(BaseModule):
@@ -19,7 +19,7 @@ class DeRasterModule(BaseModule):
 
     def detect(self, image) -> Tuple[bool, Dict[str, Any]]:
         """Detect presence of grid lines, stamps, or watermarks."""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        gray = to_gray(image)
 
         # Detect grid lines using Hough transform
         edges = cv2.Canny(gray, 50, 150)
@@ -58,7 +58,7 @@ class DeRasterModule(BaseModule):
     def process(self, image, detect_meta: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
         """Remove grids, stamps, and watermarks."""
         result = image.copy()
-        gray = cv2.cvtColor(result, cv2.COLOR_BGR2GRAY) if len(result.shape) == 3 else result
+        gray = to_gray(image)
 
         # Step 1: Grid Line Removal
         if detect_meta.get("grid_detected"):
@@ -121,7 +121,7 @@ class DeRasterModule(BaseModule):
 
     def _remove_watermark(self, image):
         """Remove watermarks using frequency domain filtering."""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        gray = to_gray(image)
 
         # FFT
         f_transform = np.fft.fft2(gray)
@@ -12,9 +12,8 @@ from __future__ import annotations
 from typing import Tuple, Dict, Any
 
 import cv2
-import numpy as np
 
-from .base_module import BaseModule
+from .base_module import BaseModule, to_gray
 from ..utils import config
 
 class DenoiseModule(BaseModule):
@@ -22,10 +21,10 @@ class DenoiseModule(BaseModule):
 
     def detect(self, image) -> Tuple[bool, Dict[str, Any]]:
         """Always return True but report metrics so processing can adapt its strength."""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        lap_var = float(cv2.Laplacian(gray, cv2.CV_64F).var())
+        gray = to_gray(image)
+        lap_var = float(cv2.Laplacian(gray, cv2.CV_16S).var())
         blurred = cv2.GaussianBlur(gray, (3, 3), 0)
-        noise_level = float(np.mean(np.abs(gray.astype(np.float32) - blurred.astype(np.float32))))
+        noise_level = float(cv2.mean(cv2.absdiff(gray, blurred))[0])
         return True, {
             "laplacian_variance": lap_var,
             "noise_level": noise_level,
@@ -39,7 +38,7 @@ class DenoiseModule(BaseModule):
             denoised = cv2.fastNlMeansDenoisingColored(image, None, strength, strength, 7, 21)
             return denoised, {"applied": True, "method": "fastNlMeans", "strength": strength}
         except Exception:  # pylint: disable=broad-except
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            gray = to_gray(image)
             k = 5 if detect_meta.get("high_noise") else 3
             median = cv2.medianBlur(gray, k)
             restored = cv2.cvtColor(median, cv2.COLOR_GRAY2BGR)
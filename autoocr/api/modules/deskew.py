@@ -19,14 +19,14 @@ import math
 import cv2
 import numpy as np
 
-from .base_module import BaseModule
+from .base_module import BaseModule, to_gray
 from ..utils import config
 
 class DeskewModule(BaseModule):
     name = "deskew"
 
     def detect(self, image) -> Tuple[bool, Dict[str, Any]]:
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = to_gray(image)
         # Binary inversion to highlight text
         blur = cv2.GaussianBlur(gray, (5, 5), 0)
         thresh = cv2.threshold(blur, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
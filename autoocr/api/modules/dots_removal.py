@@ -16,7 +16,7 @@ from typing import Tuple, Dict, Any
 import cv2
 import numpy as np
 
-from .base_module import BaseModule
+from .base_module import BaseModule, to_gray
 
 
 class DotsRemovalModule(BaseModule):
@@ -24,7 +24,7 @@ class DotsRemovalModule(BaseModule):
 
     def detect(self, image) -> Tuple[bool, Dict[str, Any]]:
         """Detect presence of background dots/speckles."""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = to_gray(image)
 
         # Apply threshold to find potential dots
         _, binary = cv2.threshold(gray, 200, 255, cv2.THRESH_BINARY_INV)
@@ -56,7 +56,7 @@ class DotsRemovalModule(BaseModule):
 
     def process(self, image, detect_meta: Dict[str, Any]):
         """Remove background dots using multi-stage approach."""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = to_gray(image)
 
         # Stage 1: Adaptive thresholding
         thresh = cv2.adaptiveThreshold(
@@ -23,7 +23,7 @@ from typing import Tuple, Dict, Any
 import cv2
 import numpy as np
 
-from .base_module import BaseModule
+from .base_module import BaseModule, to_gray
 
 class EdgeMaskModule(BaseModule):
     name = "edge_mask"
@@ -32,7 +32,7 @@ class EdgeMaskModule(BaseModule):
         self.area_threshold = area_threshold
 
     def detect(self, image) -> Tuple[bool, Dict[str, Any]]:
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = to_gray(image)
         # Threshold: keep bright -> 255, dark -> 0 (inverse-ish by using low thresh + binary)
         _, thresh = cv2.threshold(gray, 10, 255, cv2.THRESH_BINARY)
         contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -91,7 +91,7 @@ class EdgeMaskModule(BaseModule):
         }
 
     def process(self, image, detect_meta: Dict[str, Any]):
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = to_gray(image)
         _, thresh = cv2.threshold(gray, 10, 255, cv2.THRESH_BINARY)
         contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         if not contours:
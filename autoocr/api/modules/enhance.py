@@ -12,7 +12,7 @@ from typing import Tuple, Dict, Any
 import cv2
 import numpy as np
 
-from .base_module import BaseModule
+from .base_module import BaseModule, to_gray
 from ..utils import config
 
 class EnhanceModule(BaseModule):
@@ -20,9 +20,9 @@ class EnhanceModule(BaseModule):
 
     def detect(self, image) -> Tuple[bool, Dict[str, Any]]:
         """Always return True with metrics; processing adapts intensity to avoid over-enhancing."""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = to_gray(image)
         contrast = float(np.std(gray))
-        lap_var = float(cv2.Laplacian(gray, cv2.CV_64F).var())
+        lap_var = float(cv2.Laplacian(gray, cv2.CV_16S).var())
         brightness = float(np.mean(gray))
         low_contrast = contrast < config.LOW_CONTRAST_STD_THRESHOLD
         blurry = lap_var < config.LAPLACIAN_VARIANCE_SHARPNESS_THRESHOLD
@@ -37,7 +37,7 @@ class EnhanceModule(BaseModule):
         }
 
     def process(self, image, detect_meta: Dict[str, Any]):
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = to_gray(image)
         # Adaptive CLAHE clip limit: lower if already high contrast
         base_clip = config.CLAHE_CLIP_LIMIT
         clip_limit = base_clip * (0.6 if detect_meta.get("contrast_std", 0) > 70 else 1.0)
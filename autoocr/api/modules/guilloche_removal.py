@@ -7,7 +7,7 @@ removed while preserving text.
 import cv2
 import numpy as np
 from typing import Tuple, Dict, Any
-from .base_module import BaseModule
+from .base_module import BaseModule, to_gray
 
 
 class GuillocheRemovalModule(BaseModule):
@@ -32,7 +32,7 @@ class GuillocheRemovalModule(BaseModule):
         Returns:
             (should_process, metadata) tuple
         """
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        gray = to_gray(image)
 
         # Perform FFT
         f = np.fft.fft2(gray)
@@ -78,7 +78,7 @@ class GuillocheRemovalModule(BaseModule):
             (processed_image, process_metadata) tuple
         """
         is_color = len(image.shape) == 3
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if is_color else image
+        gray = to_gray(image)
 
         # Perform 2D FFT
         f = np.fft.fft2(gray)
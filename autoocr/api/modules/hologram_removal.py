@@ -6,7 +6,7 @@ and distortion in security documents.
 import cv2
 import numpy as np
 from typing import Tuple, Dict, Any
-from .base_module import BaseModule
+from .base_module import BaseModule, to_gray
 
 
 class HologramRemovalModule(BaseModule):
@@ -31,7 +31,7 @@ class HologramRemovalModule(BaseModule):
         Returns:
             (should_process, metadata) tuple
         """
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        gray = to_gray(image)
 
         # Detect very bright regions (typical of hologram reflections)
         _, bright_mask = cv2.threshold(gray, self.reflection_threshold, 255, cv2.THRESH_BINARY)
@@ -73,7 +73,7 @@ class HologramRemovalModule(BaseModule):
             (processed_image, process_metadata) tuple
         """
         is_color = len(image.shape) == 3
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if is_color else image
+        gray = to_gray(image)
 
         # Create reflection mask
         if is_color:
@@ -6,7 +6,7 @@ Maximizes OCR readability while preserving MRZ integrity.
 import cv2
 import numpy as np
 from typing import Tuple, Dict, Any, Optional
-from .base_module import BaseModule
+from .base_module import BaseModule, to_gray
 
 
 class MRZEnhancementModule(BaseModule):
@@ -30,7 +30,7 @@ class MRZEnhancementModule(BaseModule):
         Returns:
             (should_process, metadata) tuple
         """
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        gray = to_gray(image)
         height, width = gray.shape
 
         # MRZ is always at bottom, typically bottom 10-15%
@@ -109,7 +109,7 @@ class MRZEnhancementModule(BaseModule):
             (processed_image, process_metadata) tuple
         """
         is_color = len(image.shape) == 3
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if is_color else image
+        gray = to_gray(image)
 
         height, width = gray.shape
         mrz_bbox = detect_meta.get("mrz_bbox")
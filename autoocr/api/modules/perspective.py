@@ -18,7 +18,7 @@ from typing import Tuple, Dict, Any
 import cv2
 import numpy as np
 
-from .base_module import BaseModule
+from .base_module import BaseModule, to_gray
 
 
 class PerspectiveModule(BaseModule):
@@ -29,7 +29,7 @@ class PerspectiveModule(BaseModule):
         self.skew_tolerance = skew_tolerance
 
     def detect(self, image) -> Tuple[bool, Dict[str, Any]]:
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = to_gray(image)
         blur = cv2.GaussianBlur(gray, (5, 5), 0)
         edges = cv2.Canny(blur, 50, 150)
         contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -5,8 +5,7 @@ Increases clarity of characters and highlights fine details without introducing
 from __future__ import annotations
 from typing import Tuple, Dict, Any
 import cv2
-import numpy as np
-from .base_module import BaseModule
+from .base_module import BaseModule, to_gray
 
 
 class SharpenModule(BaseModule):
@@ -16,10 +15,10 @@ class SharpenModule(BaseModule):
 
     def detect(self, image) -> Tuple[bool, Dict[str, Any]]:
         """Detect if sharpening is needed (blurry images)."""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        gray = to_gray(image)
 
         # Laplacian variance indicates blurriness
-        laplacian_var = float(cv2.Laplacian(gray, cv2.CV_64F).var())
+        laplacian_var = float(cv2.Laplacian(gray, cv2.CV_16S).var())
 
         # Low variance = blurry
         is_blurry = bool(laplacian_var < 100)
@@ -49,7 +48,7 @@ class SharpenModule(BaseModule):
     def _enhance_edges(self, image):
         """Enhance edges using unsharp masking."""
         if len(image.shape) == 3:
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            gray = to_gray(image)
             color_image = image
         else:
             gray = image
@@ -75,7 +74,7 @@ class SharpenModule(BaseModule):
     def _refine_details(self, image):
         """Refine details using high-pass filtering."""
         if len(image.shape) == 3:
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            gray = to_gray(image)
             result_img = image.copy()
         else:
             gray = image
@@ -86,14 +85,8 @@ class SharpenModule(BaseModule):
         low_pass = cv2.GaussianBlur(gray, (5, 5), 1)
         high_pass = cv2.subtract(gray, low_pass)
 
-        # Convert to float for processing
-        high_pass_float = high_pass.astype(np.float32) / 255.0
-        gray_float = gray.astype(np.float32) / 255.0
-
-        # Add high-pass details back
-        detailed = gray_float + high_pass_float * 0.5
-        detailed = np.clip(detailed, 0, 1)
-        detailed = (detailed * 255).astype(np.uint8)
+        # Add high-pass details back (saturating uint8 arithmetic, no float copies)
+        detailed = cv2.addWeighted(gray, 1.0, high_pass, 0.5, 0)
 
         # Convert back to BGR if needed
         if len(image.shape) == 3:
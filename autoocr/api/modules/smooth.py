@@ -5,8 +5,7 @@ Reduces noise while preserving edges and important details.
 from __future__ import annotations
 from typing import Tuple, Dict, Any
 import cv2
-import numpy as np
-from .base_module import BaseModule
+from .base_module import BaseModule, to_gray
 
 
 class SmoothModule(BaseModule):
@@ -16,13 +15,12 @@ class SmoothModule(BaseModule):
 
     def detect(self, image) -> Tuple[bool, Dict[str, Any]]:
         """Detect if smoothing is needed (grainy images)."""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        gray = to_gray(image)
 
         # Measure graininess using gradient magnitude
-        sobelx = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3)
-        sobely = cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=3)
-        magnitude = np.sqrt(sobelx**2 + sobely**2)
-        graininess = np.mean(magnitude)
+        sobelx = cv2.Sobel(gray, cv2.CV_32F, 1, 0, ksize=3)
+        sobely = cv2.Sobel(gray, cv2.CV_32F, 0, 1, ksize=3)
+        graininess = cv2.mean(cv2.magnitude(sobelx, sobely))[0]
 
         # High gradient = grainy
         is_grainy = bool(graininess > 20)
@@ -20,14 +20,14 @@ from typing import Tuple, Dict, Any
 import cv2
 import numpy as np
 
-from .base_module import BaseModule
+from .base_module import BaseModule, to_gray
 from ..utils import config
 
 class TextRefineModule(BaseModule):
     name = "text_refine"
 
     def detect(self, image) -> Tuple[bool, Dict[str, Any]]:
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = to_gray(image)
         contrast = float(np.std(gray))
         # If already reasonably high contrast, skip refine to avoid over-processing
         if contrast > 65:
@@ -55,7 +55,7 @@ class TextRefineModule(BaseModule):
         }
 
     def process(self, image, detect_meta: Dict[str, Any]):
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = to_gray(image)
         # Sauvola adaptive threshold
         try:
             from skimage.filters import threshold_sauvola  # local import
@@ -6,7 +6,7 @@ from __future__ import annotations
 from typing import Tuple, Dict, Any, List
 import cv2
 import numpy as np
-from .base_module import BaseModule
+from .base_module import BaseModule, to_gray
 
 
 class TextSegmentationModule(BaseModule):
@@ -16,7 +16,7 @@ class TextSegmentationModule(BaseModule):
 
     def detect(self, image) -> Tuple[bool, Dict[str, Any]]:
         """Detect if text segmentation is applicable."""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        gray = to_gray(image)
 
         # Check if image contains text (has high contrast areas)
         _, binary = cv2.threshold(gray, 127, 255, cv2.THRESH_BINARY)
@@ -32,7 +32,7 @@ class TextSegmentationModule(BaseModule):
 
     def process(self, image, detect_meta: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
         """Perform text segmentation (creates metadata, returns segmented image)."""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        gray = to_gray(image)
 
         # Step 1: Line Segmentation
         line_info = self._segment_lines(gray)
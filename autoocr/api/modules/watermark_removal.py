@@ -6,7 +6,7 @@ Uses morphological operations and LAB color space for better separation.
 import cv2
 import numpy as np
 from typing import Tuple, Dict, Any
-from .base_module import BaseModule
+from .base_module import BaseModule, to_gray
 
 
 class WatermarkRemovalModule(BaseModule):
@@ -31,7 +31,7 @@ class WatermarkRemovalModule(BaseModule):
         Returns:
             (should_process, metadata) tuple
         """
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        gray = to_gray(image)
 
         # Estimate background/watermark using large morphological opening
         kernel_size = max(15, min(gray.shape) // 50)
@@ -6,14 +6,17 @@ Contract (initial draft):
 
 We introduce a BaseModule class (see modules/base_module.py) handling common interface.
 """
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Dict, Any
 import cv2
+import logging
 import time
+import numpy as np
 from .utils.logging import get_logger
 
 logger = get_logger("pipeline")
 
-from .modules.base_module import BaseModule
+from .modules.base_module import BaseModule, PageImage
 from .modules.edge_mask import EdgeMaskModule
 from .modules.orientation import OrientationModule
 from .modules.perspective import PerspectiveModule
@@ -31,8 +34,18 @@ from .modules.text_segmentation import TextSegmentationModule
 from .modules.artifact_removal import ArtifactRemovalModule
 from .modules.color_correction import ColorCorrectionModule
 
+# Per-page struct-of-arrays timing record (one row per module), cheap to stack across a batch.
+STEP_DTYPE = np.dtype([
+    ("module", "U32"),
+    ("detected", "?"),
+    ("applied", "?"),
+    ("detect_ms", "f4"),
+    ("process_ms", "f4"),
+])
+
+
 class Pipeline:
-    def __init__(self, modules: List[BaseModule] | None = None):
+    def __init__(self, modules: List[BaseModule] | None = None, collect_timings: bool = True):
         if modules is None:
             modules = [
                 EdgeMaskModule(),              # mask black borders
@@ -53,6 +66,20 @@ class Pipeline:
                 ArtifactRemovalModule(),       # fold marks, tape, pattern removal
             ]
         self.modules = modules
+        # When False (and debug logging is off) steps omit `timing_ms` and no clocks are read.
+        self.collect_timings = collect_timings
+
+    @property
+    def modules(self) -> List[BaseModule]:
+        return self._modules
+
+    @modules.setter
+    def modules(self, modules: List[BaseModule]) -> None:
+        # Resolve names and bound methods once per module list instead of per page;
+        # reassigning `modules` (e.g. API module filtering) rebuilds the plan.
+        self._modules = modules
+        self._plan = tuple((m.name, m.detect, m.process) for m in modules)
+        self._names = np.array([m.name for m in modules], dtype=STEP_DTYPE["module"])
 
     def run_page(self, image) -> Dict[str, Any]:
         """Run detection + conditional processing for a single page image.
@@ -61,50 +88,112 @@ class Pipeline:
           original: original image (BGR)
           final: final processed image (BGR)
           steps: list of {module, detected, applied, meta}
+          timings: STEP_DTYPE structured array, one row per module
         """
-        work_img = image.copy()
+        # PageImage caches the grayscale conversion shared by module detect/process calls
+        work_img = PageImage.wrap(image.copy())
         steps = []
+        timings = np.zeros(len(self._plan), dtype=STEP_DTYPE)
+        timings["module"] = self._names
         pre_binarize_snapshot = None
-        for module in self.modules:
-            t0 = time.time()
-            detected, detect_meta = module.detect(work_img)
-            t1 = time.time()
+        debug = logger.isEnabledFor(logging.DEBUG)
+        timed = debug or self.collect_timings
+        clock = time.perf_counter
+        for idx, (name, detect, process) in enumerate(self._plan):
+            if timed:
+                t0 = clock()
+            detected, detect_meta = detect(work_img)
+            if timed:
+                t1 = clock()
             applied = False
             process_meta = None
             if detected:
                 # Capture snapshot before binarization if this is the binarize module
-                if module.name == "binarize":
-                    pre_binarize_snapshot = work_img.copy()
-                work_img, process_meta = module.process(work_img, detect_meta)
+                if name == "binarize":
+                    pre_binarize_snapshot = np.array(work_img)
+                work_img, process_meta = process(work_img, detect_meta)
+                # Fresh view -> fresh gray cache, even if the module modified pixels in place
+                work_img = PageImage.wrap(work_img)
                 applied = True
-            t2 = time.time()
-            logger.debug(
-                f"module={module.name} detected={detected} applied={applied} detect_ms={(t1-t0)*1000:.2f} process_ms={(t2-t1)*1000:.2f}")
-            steps.append({
-                "module": module.name,
+            if timed:
+                t2 = clock()
+            step = {
+                "module": name,
                 "detected": bool(detected),
                 "applied": applied,
                 "detect_meta": detect_meta,
                 "process_meta": process_meta,
-                "timing_ms": {
+            }
+            if debug:
+                logger.debug("module=%s detected=%s applied=%s detect_ms=%.2f process_ms=%.2f",
+                             name, detected, applied, (t1 - t0) * 1000, (t2 - t1) * 1000)
+            timings["detected"][idx] = detected
+            timings["applied"][idx] = applied
+            if self.collect_timings:
+                timings["detect_ms"][idx] = (t1 - t0) * 1000
+                timings["process_ms"][idx] = (t2 - t1) * 1000 if applied else 0.0
+                step["timing_ms"] = {
                     "detect": round((t1 - t0) * 1000, 2),
                     "process": round((t2 - t1) * 1000, 2) if applied else 0.0,
                     "total": round((t2 - t0) * 1000, 2),
                 }
-            })
+            steps.append(step)
         return {
             "original": image,
-            "final": work_img,
+            "final": work_img.view(np.ndarray),
             "pre_binarize": pre_binarize_snapshot,
             "steps": steps,
+            "timings": timings,
         }
 
-    def run_document(self, pages: List):
-        results = []
+    def warmup(self, size: int = 64) -> None:
+        """Run a blank page through every module once.
+
+        Pays one-off first-call costs (lazy imports such as skimage's Sauvola,
+        model loading, OpenCV kernel initialization) before real traffic arrives.
+        """
+        self.run_page(np.full((size, size, 3), 255, dtype=np.uint8))
+
+    def iter_document(self, pages: Iterable) -> Iterator[Dict[str, Any]]:
+        """Lazily run pages (list or generator) through the pipeline, one result at a time."""
         for idx, page in enumerate(pages):
             result = self.run_page(page)
             result["page_index"] = idx
-            results.append(result)
-        return results
+            yield result
+
+    def run_document(self, pages: Iterable) -> List[Dict[str, Any]]:
+        return list(self.iter_document(pages))
+
+
+@lru_cache(maxsize=1)
+def default_pipeline() -> Pipeline:
+    """Process-wide Pipeline with the default module list, built on first use.
+
+    Shared by every caller in the process, so do not reassign its `modules`;
+    construct a separate `Pipeline` for custom module lists.
+    """
+    return Pipeline()
+
+
+def summarize_timings(timings: List[np.ndarray]) -> Dict[str, Dict[str, float]]:
+    """Aggregate per-module timings across pages (the `timings` arrays from `run_page`).
+
+    Pages must share the same module list. Returns {module: {mean_detect_ms, mean_process_ms, applied_ratio}}.
+    """
+    if not timings:
+        return {}
+    batch = np.stack(timings)  # (pages, modules)
+    detect_ms = batch["detect_ms"].mean(axis=0)
+    process_ms = batch["process_ms"].mean(axis=0)
+    applied = batch["applied"].mean(axis=0)
+    return {
+        str(name): {
+            "mean_detect_ms": round(float(d), 2),
+            "mean_process_ms": round(float(p), 2),
+            "applied_ratio": round(float(a), 4),
+        }
+        for name, d, p, a in zip(batch["module"][0], detect_ms, process_ms, applied, strict=True)
+    }
+
 
-__all__ = ["Pipeline"]
+__all__ = ["Pipeline", "default_pipeline", "summarize_timings", "STEP_DTYPE"]
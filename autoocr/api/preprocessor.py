@@ -7,13 +7,18 @@ Provides three processing modes:
 """
 import cv2
 import numpy as np
+import os
+from concurrent.futures import FIRST_COMPLETED, wait
+from dataclasses import asdict
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import tempfile
 import shutil
 
 from .utils.config import ProcessingConfig, SecurityDocumentConfig, OCROptimizedConfig
+from .utils.async_io import iter_read_ahead
 from .utils.gpu_manager import get_gpu_manager
+from .utils.parallel import process_pool
 from .utils.security_detector import SecurityFeatureDetector
 from .utils.logging import get_logger
 from .pipeline import Pipeline
@@ -47,6 +52,28 @@ Users are solely responsible for legal compliance.
 """
 
 
+def _decode(data: Optional[bytes]) -> Optional[np.ndarray]:
+    """Decode read-ahead file bytes; None (unreadable/undecodable) lets process_file retry the path."""
+    return cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR) if data else None
+
+
+# Input extensions picked up by process_batch
+BATCH_SUFFIXES = (".pdf", ".tif", ".tiff", ".png", ".jpg", ".jpeg")
+
+# Per-process preprocessor for process_batch(workers > 1), built by the pool initializer
+_BATCH_WORKER: Optional["DocumentPreprocessor"] = None
+
+
+def _init_batch_worker(preprocessor_cls: type, config_cls: type, config_data: Dict[str, Any]) -> None:
+    global _BATCH_WORKER  # noqa: PLW0603
+    _BATCH_WORKER = preprocessor_cls(config_cls(**config_data))
+
+
+def _process_batch_file(data: Optional[bytes], input_file: str, output_file: str) -> Dict[str, Any]:
+    # Bytes were read ahead by the parent
+    return _BATCH_WORKER.process_file(input_file, output_file, image=_decode(data))
+
+
 class DocumentPreprocessor:
     """Complete preprocessing pipeline for scanned documents."""
 
@@ -95,74 +122,117 @@ class DocumentPreprocessor:
 
         return modules
 
-    def process_file(self, input_path: str, output_path: str) -> Dict[str, Any]:
+    def process_file(self, input_path: str, output_path: str,
+                     image: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """Process a single file through the complete pipeline.
 
         Args:
             input_path: Path to input image/PDF
             output_path: Path to save output
+            image: Already-decoded input (skips reading input_path)
 
         Returns:
             Processing results dictionary
         """
-        logger.info(f"Processing file: {input_path}")
+        logger.info("Processing file: %s", input_path)
 
         # Load image
-        img = cv2.imread(input_path)
+        img = image if image is not None else cv2.imread(input_path)
         if img is None:
             raise ValueError(f"Could not load image: {input_path}")
 
-        # Run pipeline
-        result = self.pipeline.run_page(img)
+        processed, info = self.process_array(img)
 
         # Save output
-        cv2.imwrite(output_path, result['final'])
+        cv2.imwrite(output_path, processed)
 
-        logger.info(f"Saved output: {output_path}")
+        logger.info("Saved output: %s", output_path)
 
         return {
             'success': True,
             'input_path': input_path,
             'output_path': output_path,
-            'steps': result['steps']
+            **info
         }
 
-    def process_batch(self, input_dir: str, output_dir: str) -> List[Dict[str, Any]]:
+    def process_array(self, img: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Process an already-decoded image in memory.
+
+        Args:
+            img: BGR image
+
+        Returns:
+            (processed image, report fields merged into the process_file result)
+        """
+        result = self.pipeline.run_page(img)
+        return result['final'], {'steps': result['steps']}
+
+    def process_batch(self, input_dir: str, output_dir: str, workers: int = 1) -> List[Dict[str, Any]]:
         """Process multiple documents.
 
         Args:
             input_dir: Directory containing input files
             output_dir: Directory for outputs
+            workers: Worker processes; files are independent, so >1 processes them in
+                parallel (each worker rebuilds this preprocessor from its config)
 
         Returns:
-            List of processing results
+            List of processing results, in input file order
         """
-        input_path = Path(input_dir)
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        results = []
-
-        # Find all supported files
-        patterns = ["*.pdf", "*.tif", "*.tiff", "*.png", "*.jpg", "*.jpeg"]
-        files = []
-        for pattern in patterns:
-            files.extend(input_path.glob(pattern))
+        # Find all supported files (one directory scan instead of one glob per pattern)
+        with os.scandir(input_dir) as entries:
+            files = sorted(Path(e.path) for e in entries if e.is_file() and e.name.endswith(BATCH_SUFFIXES))
+
+        logger.info("Found %d files to process", len(files))
+
+        def output_for(file: Path) -> Path:
+            return output_path / f"{file.stem}_processed{file.suffix}"
+
+        def failure(file: Path, e: Exception) -> Dict[str, Any]:
+            logger.error("Error processing %s: %s", file.name, e)
+            return {'file': file.name, 'success': False, 'error': str(e)}
+
+        if workers > 1 and len(files) > 1:
+            results: List[Optional[Dict[str, Any]]] = [None] * len(files)
+            workers = min(workers, len(files))
+            initargs = (type(self), type(self.config), asdict(self.config))
+            done = 0
+
+            def collect(finished) -> None:
+                nonlocal done
+                for future in finished:
+                    idx = futures.pop(future)
+                    file = files[idx]
+                    try:
+                        results[idx] = {'file': file.name, **future.result()}
+                    except Exception as e:
+                        results[idx] = failure(file, e)
+                    done += 1
+                    logger.info("Batch progress %d/%d: %s", done, len(files), file.name)
+
+            # The parent reads files ahead and hands workers the bytes, so disk reads
+            # overlap with decoding/processing; at most 2 * workers files are in flight.
+            with process_pool(workers, initializer=_init_batch_worker, initargs=initargs) as pool:
+                futures = {}
+                reads = iter_read_ahead(files, workers=min(4, workers), depth=2 * workers)
+                for idx, (file, data) in enumerate(reads):
+                    futures[pool.submit(_process_batch_file, data, str(file), str(output_for(file)))] = idx
+                    if len(futures) >= 2 * workers:
+                        collect(wait(futures, return_when=FIRST_COMPLETED).done)
+                collect(wait(futures).done)
+            return results
 
-        logger.info(f"Found {len(files)} files to process")
-
-        for file in files:
+        results = []
+        read_workers = min(4, os.cpu_count() or 1)
+        for file, data in iter_read_ahead(files, workers=read_workers):
             try:
-                output_file = output_path / f"{file.stem}_processed{file.suffix}"
-                result = self.process_file(str(file), str(output_file))
+                result = self.process_file(str(file), str(output_for(file)), image=_decode(data))
                 results.append({'file': file.name, **result})
             except Exception as e:
-                logger.error(f"Error processing {file.name}: {e}")
-                results.append({
-                    'file': file.name,
-                    'success': False,
-                    'error': str(e)
-                })
+                results.append(failure(file, e))
 
         return results
 
@@ -206,27 +276,50 @@ class SecurityDocumentPreprocessor(DocumentPreprocessor):
 
         return modules
 
-    def process_file(self, input_path: str, output_path: str) -> Dict[str, Any]:
+    def process_file(self, input_path: str, output_path: str,
+                     image: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """Process security document with feature preservation.
 
         Args:
             input_path: Path to input image
             output_path: Path to save output
+            image: Already-decoded input (skips reading input_path)
 
         Returns:
             Processing results with compliance information
         """
-        logger.info(f"Processing security document: {input_path}")
-
-        # Analyze document
-        analysis = self.security_detector.analyze(input_path)
-        logger.info(f"Detected: {analysis['document_type']}, Features: {analysis['features']}")
+        logger.info("Processing security document: %s", input_path)
 
         # Load image
-        img = cv2.imread(input_path)
+        img = image if image is not None else cv2.imread(input_path)
         if img is None:
             raise ValueError(f"Could not load image: {input_path}")
 
+        processed, info = self.process_array(img)
+
+        # Save output
+        cv2.imwrite(output_path, processed)
+
+        return {
+            'success': True,
+            'input_path': input_path,
+            'output_path': output_path,
+            **info
+        }
+
+    def process_array(self, img: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Process an already-decoded security document in memory.
+
+        Args:
+            img: BGR image
+
+        Returns:
+            (processed image, report fields with compliance information)
+        """
+        # Analyze document
+        analysis = self.security_detector.analyze_image(img)
+        logger.info("Detected: %s, Features: %s", analysis['document_type'], analysis['features'])
+
         # Only proceed if skew is significant
         if abs(analysis['skew_angle']) > 2.0:
             result = self.pipeline.run_page(img)
@@ -236,13 +329,7 @@ class SecurityDocumentPreprocessor(DocumentPreprocessor):
             processed = img
             result = {'steps': [], 'final': img}
 
-        # Save output
-        cv2.imwrite(output_path, processed)
-
-        return {
-            'success': True,
-            'input_path': input_path,
-            'output_path': output_path,
+        return processed, {
             'document_type': analysis['document_type'],
             'security_features_preserved': analysis['features'],
             'compliance': 'ICAO 9303' if analysis['document_type'] == 'passport' else 'N/A',
@@ -304,11 +391,11 @@ class OCROptimizedPreprocessor(DocumentPreprocessor):
 
         return modules
 
-    def _check_legal_compliance(self, document_path: str) -> bool:
+    def _check_legal_compliance(self, analysis: Dict[str, Any]) -> bool:
         """Check legal authorization for processing.
 
         Args:
-            document_path: Path to document
+            analysis: Security analysis of the document (SecurityFeatureDetector.analyze_image)
 
         Returns:
             True if should proceed
@@ -316,57 +403,77 @@ class OCROptimizedPreprocessor(DocumentPreprocessor):
         if not self.config.legal_compliance_check:
             return True
 
-        # Analyze document type
-        analysis = self.security_detector.analyze(document_path)
         doc_type = analysis['document_type']
 
         if doc_type in ['passport', 'currency']:
             print(LEGAL_WARNING)
-            logger.warning(f"Detected {doc_type} - requires legal authorization")
+            logger.warning("Detected %s - requires legal authorization", doc_type)
             # In production, this should check actual authorization
             # For now, log warning and proceed
             return True
 
         return True
 
-    def process_file(self, input_path: str, output_path: str) -> Dict[str, Any]:
+    def process_file(self, input_path: str, output_path: str,
+                     image: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """Process document with aggressive security feature removal.
 
         Args:
             input_path: Path to input image
             output_path: Path to save output
+            image: Already-decoded input (skips reading input_path)
 
         Returns:
             Processing results with OCR improvement metrics
         """
+        # Load once; the compliance check and processing share one analysis of the array
+        img = image if image is not None else cv2.imread(input_path)
+        if img is None:
+            raise ValueError(f"Could not load image: {input_path}")
+        analysis = self.security_detector.analyze_image(img)
+
         # Legal compliance check
-        if not self._check_legal_compliance(input_path):
+        if not self._check_legal_compliance(analysis):
             return {
                 'success': False,
                 'error': 'Legal authorization required'
             }
 
-        logger.info(f"OCR-optimizing document: {input_path}")
+        logger.info("OCR-optimizing document: %s", input_path)
 
-        # Analyze document
-        analysis = self.security_detector.analyze_image(cv2.imread(input_path))
-
-        # Load and process
-        img = cv2.imread(input_path)
-        if img is None:
-            raise ValueError(f"Could not load image: {input_path}")
-
-        result = self.pipeline.run_page(img)
+        processed, info = self.process_array(img, analysis)
 
         # Save output
-        cv2.imwrite(output_path, result['final'])
+        cv2.imwrite(output_path, processed)
 
-        logger.info(f"OCR-optimized output saved: {output_path}")
+        logger.info("OCR-optimized output saved: %s", output_path)
 
         return {
             'success': True,
             'input_path': input_path,
             'output_path': output_path,
+            **info
+        }
+
+    def process_array(self, img: np.ndarray,
+                      analysis: Optional[Dict[str, Any]] = None) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Remove security features from an already-decoded image in memory.
+
+        The legal compliance check stays in process_file.
+
+        Args:
+            img: BGR image
+            analysis: Security analysis of img, if already computed
+
+        Returns:
+            (processed image, report fields with the removed features)
+        """
+        if analysis is None:
+            analysis = self.security_detector.analyze_image(img)
+
+        result = self.pipeline.run_page(img)
+
+        return result['final'], {
             'document_type': analysis['document_type'],
             'security_features_removed': analysis['features'],
             'steps': result['steps']
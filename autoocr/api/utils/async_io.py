@@ -0,0 +1,93 @@
+"""Overlapped I/O helpers.
+
+Batch commands read many input files before any decoding can start. Reading
+them through a small thread pool keeps several reads in flight (the GIL is
+released during read syscalls) while already-loaded files are decoded.
+`iter_prefetch` does the same for any producer (e.g. PDF rasterization, which
+waits on poppler) by running it on a background thread behind a bounded queue.
+"""
+from __future__ import annotations
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Tuple, TypeVar
+
+from .logging import get_logger
+
+logger = get_logger("async_io")
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+def _read_or_none(path: Path) -> Optional[bytes]:
+    try:
+        return path.read_bytes()
+    except OSError as e:
+        logger.warning("Could not read %s: %s", path, e)
+        return None
+
+
+def iter_read_ahead(paths: Iterable[Path], workers: int = 4, depth: int = 8) -> Iterator[Tuple[Path, Optional[bytes]]]:
+    """Yield (path, contents) in order, reading up to `depth` files ahead.
+
+    Unreadable files yield None so callers can report them alongside decode errors.
+    """
+    path_iter = iter(paths)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="read-ahead") as pool:
+        pending = deque((p, pool.submit(_read_or_none, p)) for p in islice(path_iter, depth))
+        while pending:
+            path, future = pending.popleft()
+            nxt = next(path_iter, None)
+            if nxt is not None:
+                pending.append((nxt, pool.submit(_read_or_none, nxt)))
+            yield path, future.result()
+
+
+def iter_prefetch(items: Iterable[T], maxsize: int = 4) -> Iterator[T]:
+    """Yield `items` in order, produced on a background thread at most `maxsize` ahead.
+
+    The bounded queue applies back-pressure so at most `maxsize` produced items are
+    waiting. Producer exceptions are re-raised in the consumer; closing the generator
+    early stops the producer before its next item.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=max(1, maxsize))
+    stop = threading.Event()
+
+    def put(entry) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put((None, item)):
+                    return
+        except BaseException as e:  # pylint: disable=broad-except
+            put((e, None))
+            return
+        put((_DONE, None))
+
+    threading.Thread(target=produce, name="prefetch", daemon=True).start()
+    try:
+        while True:
+            status, item = buffer.get()
+            if status is _DONE:
+                return
+            if status is not None:
+                raise status
+            yield item
+    finally:
+        stop.set()
+
+
+__all__ = ["iter_read_ahead", "iter_prefetch"]
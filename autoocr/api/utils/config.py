@@ -5,7 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional
 from pathlib import Path
-import yaml
+
+from .config_loader import read_yaml
 
 EDGE_AREA_THRESHOLD = 0.90  # ratio; if largest contour smaller -> border assumed
 LAPLACIAN_VARIANCE_NOISE_THRESHOLD = 50.0
@@ -71,8 +72,7 @@ class ProcessingConfig:
     @classmethod
     def from_yaml(cls, path: Path):
         """Load configuration from YAML file"""
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        data = read_yaml(path)
         return cls(**data.get('pipeline', {}))
 
 
@@ -8,8 +8,10 @@ Search order:
 Merges into a dict; caller can then map values onto config module variables.
 """
 from __future__ import annotations
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
+import copy
 import os
 
 try:
@@ -17,6 +19,28 @@ try:
 except Exception:  # pylint: disable=broad-except
     yaml = None  # type: ignore
 
+try:  # libyaml-backed loader is ~10x faster than the pure-Python one
+    from yaml import CSafeLoader as _SafeLoader  # type: ignore
+except Exception:  # pylint: disable=broad-except
+    _SafeLoader = getattr(yaml, "SafeLoader", None)
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml(path: str, mtime_ns: int) -> Any:  # mtime_ns only participates in the cache key
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
+def read_yaml(path: str | Path) -> Any:
+    """Parse a YAML file, reusing the parsed result while the file is unchanged.
+
+    Returns a deep copy so callers may mutate the result without poisoning the cache.
+    """
+    if not yaml:
+        raise RuntimeError("PyYAML not installed; add 'pyyaml' to requirements to use config files")
+    p = Path(path).resolve()
+    return copy.deepcopy(_parse_yaml(str(p), p.stat().st_mtime_ns))
+
 
 def load_config(path: Optional[str] = None) -> Dict[str, Any]:
     candidates = []
@@ -29,13 +53,10 @@ def load_config(path: Optional[str] = None) -> Dict[str, Any]:
 
     for p in candidates:
         if p.exists() and p.is_file():
-            if not yaml:
-                raise RuntimeError("PyYAML not installed; add 'pyyaml' to requirements to use config files")
-            with p.open("r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+            data = read_yaml(p) or {}
             if not isinstance(data, dict):
                 raise ValueError("Configuration root must be a mapping")
             return data
     return {}
 
-__all__ = ["load_config"]
+__all__ = ["load_config", "read_yaml"]
@@ -6,10 +6,21 @@ import cv2
 import numpy as np
 from typing import Optional, Any
 from .logging import get_logger
+from .parallel import get_cv_threads, set_cv_threads
 
 logger = get_logger("gpu_manager")
 
 
+def _simd_summary() -> str:
+    """Baseline + dispatched SIMD features from the OpenCV build information."""
+    found = {}
+    for line in cv2.getBuildInformation().splitlines():
+        key, _, value = line.strip().partition(":")
+        if key in ("Baseline", "Dispatched code generation") and key not in found:
+            found[key] = value.strip()
+    return f"baseline=[{found.get('Baseline', '?')}] dispatched=[{found.get('Dispatched code generation', '?')}]"
+
+
 class GPUManager:
     """Manages GPU acceleration for OpenCV operations."""
 
@@ -18,10 +29,14 @@ class GPUManager:
         self.has_tensorrt = self._check_tensorrt()
 
         if self.has_cuda:
-            logger.info(f"CUDA enabled: {cv2.cuda.getCudaEnabledDeviceCount()} device(s) found")
+            logger.info("CUDA enabled: %d device(s) found", cv2.cuda.getCudaEnabledDeviceCount())
         else:
             logger.info("CUDA not available, using CPU")
 
+        # Respect a thread count already pinned by a pool worker initializer
+        threads = get_cv_threads() or set_cv_threads()
+        logger.info("OpenCV optimized=%s threads=%s simd: %s", cv2.useOptimized(), threads, _simd_summary())
+
     def _check_cuda(self) -> bool:
         """Check if CUDA is available in OpenCV."""
         try:
@@ -7,15 +7,17 @@ Features added over baseline implementation:
   - Optional grayscale output to reduce memory.
   - Optional metadata collection (dimensions, dpi, index).
   - Memory / size safeguards to prevent OOM on huge PDFs.
-  - Configurable PDF export (optimize, JPEG quality, RGB forcing, downscale).
+  - Configurable PDF export (optimize, JPEG quality, RGB forcing, downscale),
+    streamed page by page as embedded JPEG.
 
 Backwards compatibility:
   Existing calls (`pdf_to_images(bytes)`) still work, returning a list of BGR numpy arrays.
-  New parameters are optional with sane defaults.
+  New parameters are optional with sane defaults. A file path may be passed
+  instead of bytes, letting poppler read the file directly.
 """
 from __future__ import annotations
 
-from typing import List, Tuple, Dict, Any, Optional
+from typing import Iterable, Iterator, List, Tuple, Dict, Any, Optional, Union
 from dataclasses import dataclass, asdict
 from io import BytesIO
 import math
@@ -23,8 +25,10 @@ import os
 
 import cv2
 import numpy as np
-from pdf2image import convert_from_bytes
-from PIL import Image
+from pdf2image import convert_from_bytes, convert_from_path, pdfinfo_from_bytes, pdfinfo_from_path
+
+# PDF input: raw bytes, or a path poppler reads directly (no in-memory copy, no temp file)
+PdfSource = Union[bytes, str, "os.PathLike[str]"]
 
 ###############################################################################
 # Data structures
@@ -43,20 +47,21 @@ class PageMeta:
 ###############################################################################
 
 def pdf_to_images(
-    pdf_bytes: bytes,
+    pdf_bytes: PdfSource,
     dpi: int = 300,
     grayscale: bool = False,
     max_pages: Optional[int] = None,
     max_total_pixels: int = 250_000_000,  # ~250M px ≈ <1 GB @ uint8 * 3
     return_metadata: bool = False,
     poppler_path: Optional[str] = None,
+    workers: Optional[int] = None,
 ) -> List[np.ndarray] | Tuple[List[np.ndarray], List[PageMeta]]:
     """Convert PDF bytes to list of images (BGR or GRAY) with safeguards.
 
     Parameters
     ----------
-    pdf_bytes : bytes
-        Raw PDF content.
+    pdf_bytes : bytes or path
+        Raw PDF content, or the path of a PDF file.
     dpi : int, default 300
         Rasterization resolution. 300 is a good OCR balance.
     grayscale : bool, default False
@@ -69,6 +74,10 @@ def pdf_to_images(
         If True, returns (images, metadata_list). Else just images list.
     poppler_path : Optional[str]
         Explicit path to poppler binaries (Windows or custom installations).
+    workers : Optional[int]
+        Number of parallel pdftoppm processes; pages are split into contiguous
+        ranges, one per worker, and returned in document order. Defaults to
+        ``min(4, os.cpu_count())``.
 
     Returns
     -------
@@ -82,17 +91,18 @@ def pdf_to_images(
     RuntimeError
         If PDF cannot be rasterized or pixel budget exceeded.
     """
+    if workers is None:
+        workers = min(4, os.cpu_count() or 1)
     try:
-        kwargs: Dict[str, Any] = {"dpi": dpi}
+        kwargs: Dict[str, Any] = {"dpi": dpi, "grayscale": grayscale, "thread_count": max(1, workers)}
         if poppler_path:
             kwargs["poppler_path"] = poppler_path
-        pil_pages = convert_from_bytes(pdf_bytes, **kwargs)
+        if max_pages is not None:
+            # Let poppler stop early instead of rasterizing pages we would discard
+            kwargs["last_page"] = max_pages
+        pil_pages = _convert(pdf_bytes, **kwargs)
     except Exception as e:  # pylint: disable=broad-except
-        msg = (
-            f"PDF rasterization failed: {e}. If this is a poppler issue, "
-            "install poppler (macOS: 'brew install poppler', Ubuntu: 'apt-get install poppler-utils')."
-        )
-        raise RuntimeError(msg) from e
+        raise _rasterization_error(e) from e
 
     if max_pages is not None:
         pil_pages = pil_pages[:max_pages]
@@ -101,47 +111,134 @@ def pdf_to_images(
     meta: List[PageMeta] = []
     total_pixels = 0
     for i, pil_img in enumerate(pil_pages):
-        arr_rgb = np.array(pil_img)  # RGB
+        arr_rgb = np.asarray(pil_img)  # RGB (or L when grayscale); cv2 writes the only copy
         h, w = arr_rgb.shape[:2]
         total_pixels += (h * w)
         if total_pixels > max_total_pixels:
             raise RuntimeError(
                 f"Aborting: total pixel budget exceeded (> {max_total_pixels}). Consider lowering dpi or limiting pages."  # noqa: E501
             )
-        if grayscale:
-            gray = cv2.cvtColor(arr_rgb, cv2.COLOR_RGB2GRAY)
-            images.append(gray)
-            mode = "GRAY"
-        else:
-            bgr = cv2.cvtColor(arr_rgb, cv2.COLOR_RGB2BGR)
-            images.append(bgr)
-            mode = "BGR"
+        img, mode = _from_rgb(arr_rgb, grayscale)
+        images.append(img)
         meta.append(PageMeta(index=i, width=w, height=h, dpi=dpi, mode=mode))
 
     return (images, meta) if return_metadata else images
 
+
+def pdf_to_images_iter(
+    pdf_bytes: PdfSource,
+    dpi: int = 300,
+    grayscale: bool = False,
+    max_pages: Optional[int] = None,
+    poppler_path: Optional[str] = None,
+    chunk_pages: int = 4,
+) -> Iterator[np.ndarray]:
+    """Lazily rasterize a PDF, yielding one BGR (or GRAY) page at a time.
+
+    Pages are rendered in windows of `chunk_pages` per poppler call, so a long
+    document costs one pdftoppm process per window rather than per page, while
+    peak memory stays at roughly one window regardless of document length
+    (unlike `pdf_to_images`). Wrap with `list()` when list semantics are needed.
+
+    Raises
+    ------
+    RuntimeError
+        If the PDF cannot be inspected or a page cannot be rasterized.
+    """
+    kwargs: Dict[str, Any] = {"dpi": dpi, "grayscale": grayscale}
+    if poppler_path:
+        kwargs["poppler_path"] = poppler_path
+    try:
+        page_count = int(_pdfinfo(pdf_bytes, poppler_path=poppler_path)["Pages"])
+    except Exception as e:  # pylint: disable=broad-except
+        raise _rasterization_error(e) from e
+    if max_pages is not None:
+        page_count = min(page_count, max_pages)
+
+    chunk_pages = max(1, chunk_pages)
+    for first in range(1, page_count + 1, chunk_pages):
+        last = min(first + chunk_pages - 1, page_count)
+        try:
+            pil_pages = _convert(pdf_bytes, first_page=first, last_page=last, **kwargs)
+        except Exception as e:  # pylint: disable=broad-except
+            raise _rasterization_error(e) from e
+        # Pop as we go so each page is released once the consumer moves on
+        pil_pages.reverse()
+        while pil_pages:
+            yield _from_rgb(np.asarray(pil_pages.pop()), grayscale)[0]
+
+
+def _convert(pdf: PdfSource, **kwargs: Any) -> List[Any]:
+    if isinstance(pdf, (str, os.PathLike)):
+        return convert_from_path(pdf, **kwargs)
+    return convert_from_bytes(pdf, **kwargs)
+
+
+def _pdfinfo(pdf: PdfSource, **kwargs: Any) -> Dict[str, Any]:
+    if isinstance(pdf, (str, os.PathLike)):
+        return pdfinfo_from_path(pdf, **kwargs)
+    return pdfinfo_from_bytes(pdf, **kwargs)
+
+
+def _from_rgb(arr_rgb: np.ndarray, grayscale: bool) -> Tuple[np.ndarray, str]:
+    """Convert a rasterized RGB page to the requested output mode.
+
+    Pages rendered by poppler with ``grayscale=True`` arrive single-channel and
+    skip the color conversion; only a read-only PIL view is copied.
+    """
+    if arr_rgb.ndim == 2:
+        return (arr_rgb if arr_rgb.flags.writeable else arr_rgb.copy()), "GRAY"
+    if _is_achromatic(arr_rgb):
+        # R == G == B: any channel is the luma and RGB is already BGR, so no conversion pass
+        if grayscale:
+            return np.ascontiguousarray(arr_rgb[:, :, 0]), "GRAY"
+        return (arr_rgb if arr_rgb.flags.writeable else arr_rgb.copy()), "BGR"
+    if grayscale:
+        return cv2.cvtColor(arr_rgb, cv2.COLOR_RGB2GRAY), "GRAY"
+    return cv2.cvtColor(arr_rgb, cv2.COLOR_RGB2BGR), "BGR"
+
+
+def _is_achromatic(arr_rgb: np.ndarray) -> bool:
+    """True when every pixel has R == G == B (typical for scanned text pages)."""
+    # A coarse grid rejects color pages cheaply before the full-frame comparison
+    probe = arr_rgb[::16, ::16]
+    if not (np.array_equal(probe[..., 0], probe[..., 1]) and np.array_equal(probe[..., 1], probe[..., 2])):
+        return False
+    return bool(np.array_equal(arr_rgb[..., 0], arr_rgb[..., 1]) and np.array_equal(arr_rgb[..., 1], arr_rgb[..., 2]))
+
+
+def _rasterization_error(e: Exception) -> RuntimeError:
+    return RuntimeError(
+        f"PDF rasterization failed: {e}. If this is a poppler issue, "
+        "install poppler (macOS: 'brew install poppler', Ubuntu: 'apt-get install poppler-utils')."
+    )
+
 ###############################################################################
 # Images -> PDF
 ###############################################################################
 
 def images_to_pdf(
-    images: List[np.ndarray],
+    images: Iterable[np.ndarray],
     optimize: bool = True,
     jpeg_quality: int = 85,
     force_rgb: bool = True,
     downscale_max_dim: Optional[int] = None,
     metadata: Optional[Dict[str, Any]] = None,
 ) -> bytes:
-    """Convert list of images (BGR or GRAY) to a single PDF.
+    """Convert images (BGR or GRAY) to a single PDF.
+
+    Each page is JPEG-encoded as soon as it is consumed and embedded as-is
+    (DCTDecode), so only one decoded page is resident at a time; `images` may be
+    a generator.
 
     Parameters
     ----------
-    images : list[np.ndarray]
+    images : iterable of np.ndarray
         Input images (BGR 3-channel or single-channel grayscale).
     optimize : bool
-        Pass Pillow optimize flag (can reduce size).
+        Emit optimized Huffman tables (smaller JPEG streams).
     jpeg_quality : int
-        Quality hint (applies to JPEG-encoded streams; 1–95 typical).
+        JPEG quality (1–95; values outside that range fall back to 75).
     force_rgb : bool
         Convert grayscale to RGB for wider PDF viewer compatibility.
     downscale_max_dim : Optional[int]
@@ -159,44 +256,94 @@ def images_to_pdf(
     ValueError
         If no images provided or unsupported image shape.
     """
-    if not images:
+    params = [cv2.IMWRITE_JPEG_QUALITY, jpeg_quality if 1 <= jpeg_quality <= 95 else 75]
+    if optimize:
+        params += [cv2.IMWRITE_JPEG_OPTIMIZE, 1]
+
+    pages = (_encode_jpeg_page(arr, params, force_rgb, downscale_max_dim) for arr in images)
+    # (Future) embed metadata via the document info dictionary, currently skipped.
+    pdf = _write_jpeg_pdf(pages)
+    if pdf is None:
         raise ValueError("No images to write")
+    return pdf
 
-    pil_pages: List[Image.Image] = []
-    for arr in images:
-        if arr.ndim == 2:  # grayscale
-            work = arr
-            if force_rgb:
-                work = cv2.cvtColor(work, cv2.COLOR_GRAY2RGB)
-            pil_img = Image.fromarray(work)
-        elif arr.ndim == 3 and arr.shape[2] == 3:
-            rgb = cv2.cvtColor(arr, cv2.COLOR_BGR2RGB)
-            pil_img = Image.fromarray(rgb)
-        else:
-            raise ValueError(f"Unsupported image shape: {arr.shape}")
-
-        if downscale_max_dim:
-            w, h = pil_img.size
-            scale = min(downscale_max_dim / max(w, h), 1.0)
-            if scale < 1.0:
-                new_size = (int(w * scale), int(h * scale))
-                pil_img = pil_img.resize(new_size, Image.LANCZOS)
-        pil_pages.append(pil_img)
 
+def _encode_jpeg_page(
+    arr: np.ndarray,
+    params: List[int],
+    force_rgb: bool,
+    downscale_max_dim: Optional[int],
+) -> Tuple[bytes, int, int, bytes]:
+    """Encode one page to JPEG; returns (jpeg, width, height, PDF colorspace)."""
+    if arr.ndim == 2:  # grayscale
+        work = cv2.cvtColor(arr, cv2.COLOR_GRAY2BGR) if force_rgb else arr
+    elif arr.ndim == 3 and arr.shape[2] == 3:
+        work = arr  # imencode takes BGR directly, no RGB swap needed
+    else:
+        raise ValueError(f"Unsupported image shape: {arr.shape}")
+
+    if downscale_max_dim:
+        h, w = work.shape[:2]
+        scale = min(downscale_max_dim / max(w, h), 1.0)
+        if scale < 1.0:
+            # Mild reductions: bilinear is ~4x cheaper than area averaging and the JPEG
+            # quantization that follows dominates any difference. Past 2x, area
+            # averaging is needed to avoid aliasing.
+            interpolation = cv2.INTER_LINEAR if scale > 0.5 else cv2.INTER_AREA
+            work = cv2.resize(work, (int(w * scale), int(h * scale)), interpolation=interpolation)
+
+    ok, buf = cv2.imencode(".jpg", work, params)
+    if not ok:
+        raise ValueError(f"JPEG encoding failed for image of shape {arr.shape}")
+    h, w = work.shape[:2]
+    return buf.tobytes(), w, h, (b"/DeviceRGB" if work.ndim == 3 else b"/DeviceGray")
+
+
+def _write_jpeg_pdf(pages: Iterable[Tuple[bytes, int, int, bytes]]) -> Optional[bytes]:
+    """Write pre-encoded JPEG pages into a minimal PDF (one full-page image per page at 72 dpi).
+
+    Returns None when `pages` is empty.
+    """
     buf = BytesIO()
-    first, *rest = pil_pages
-    save_kwargs: Dict[str, Any] = {
-        "format": "PDF",
-        "save_all": True,
-        "append_images": rest,
-    }
-    if optimize:
-        save_kwargs["optimize"] = True
-    if 1 <= jpeg_quality <= 95:
-        save_kwargs["quality"] = jpeg_quality
+    offsets: Dict[int, int] = {}
+
+    def write_obj(num: int, body: bytes) -> None:
+        offsets[num] = buf.tell()
+        buf.write(b"%d 0 obj\n" % num)
+        buf.write(body)
+        buf.write(b"\nendobj\n")
+
+    buf.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    # Objects 1 (catalog) and 2 (page tree) are written last, once all kids are known
+    kids: List[int] = []
+    next_id = 3
+    for jpeg, w, h, colorspace in pages:
+        image_id, content_id, page_id = next_id, next_id + 1, next_id + 2
+        next_id += 3
+        write_obj(image_id, (
+            b"<< /Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace %s "
+            b"/BitsPerComponent 8 /Filter /DCTDecode /Length %d >>\nstream\n" % (w, h, colorspace, len(jpeg))
+        ) + jpeg + b"\nendstream")
+        content = b"q %d 0 0 %d 0 0 cm /Im0 Do Q" % (w, h)
+        write_obj(content_id, b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        write_obj(page_id, (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+            b"/Resources << /XObject << /Im0 %d 0 R >> >> /Contents %d 0 R >>" % (w, h, image_id, content_id)
+        ))
+        kids.append(page_id)
+
+    if not kids:
+        return None
+
+    write_obj(2, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % k for k in kids), len(kids)))
+    write_obj(1, b"<< /Type /Catalog /Pages 2 0 R >>")
 
-    # (Future) embed metadata via first.info / PdfImagePlugin, currently skipped.
-    first.save(buf, **save_kwargs)
+    xref_at = buf.tell()
+    buf.write(b"xref\n0 %d\n0000000000 65535 f \n" % next_id)
+    for num in range(1, next_id):
+        buf.write(b"%010d 00000 n \n" % offsets[num])
+    buf.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (next_id, xref_at))
     return buf.getvalue()
 
 ###############################################################################
@@ -211,6 +358,8 @@ def pdf_to_images_simple(pdf_bytes: bytes) -> List[np.ndarray]:  # legacy helper
 __all__ = [
     "pdf_to_images",
     "pdf_to_images_simple",
+    "pdf_to_images_iter",
     "images_to_pdf",
     "PageMeta",
+    "PdfSource",
 ]
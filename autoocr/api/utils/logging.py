@@ -3,9 +3,15 @@ from __future__ import annotations
 import json
 import logging
 import os
-from typing import Any
+from typing import Any, Dict
+
+try:  # optional fast JSON encoder
+    import orjson  # type: ignore
+except Exception:  # pylint: disable=broad-except
+    orjson = None  # type: ignore
 
 _LOGGER = None
+_CHILDREN: Dict[str, logging.Logger] = {}
 
 
 class JsonFormatter(logging.Formatter):
@@ -17,13 +23,20 @@ class JsonFormatter(logging.Formatter):
         }
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
-        return json.dumps(payload, ensure_ascii=False)
+        if orjson is not None:
+            return orjson.dumps(payload).decode("utf-8")
+        # Compact, unescaped UTF-8: the same line orjson emits, so log parsers see one format
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
 
 
 def get_logger(name: str = "autoocr") -> logging.Logger:
     global _LOGGER  # noqa: PLW0603
+    child = _CHILDREN.get(name)
+    if child is not None:
+        return child
     if _LOGGER is not None:
-        return _LOGGER.getChild(name)
+        child = _CHILDREN[name] = _LOGGER.getChild(name)
+        return child
     base = logging.getLogger("autoocr")
     level = os.environ.get("AUTOOCR_LOG_LEVEL", "INFO").upper()
     base.setLevel(level)
@@ -32,6 +45,7 @@ def get_logger(name: str = "autoocr") -> logging.Logger:
     base.addHandler(handler)
     base.propagate = False
     _LOGGER = base
-    return base.getChild(name)
+    child = _CHILDREN[name] = base.getChild(name)
+    return child
 
 __all__ = ["get_logger"]
\ No newline at end of file
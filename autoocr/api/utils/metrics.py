@@ -1,11 +1,11 @@
 """Simple in-memory metrics for AutoOCR."""
 from __future__ import annotations
-from dataclasses import dataclass, asdict
-from typing import Dict, Any
-from threading import Lock
+from dataclasses import dataclass, asdict, fields
+from typing import Dict, Any, List, Tuple
+from threading import Lock, local
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricState:
     requests: int = 0
     pages: int = 0
@@ -13,21 +13,47 @@ class MetricState:
 
 
 class MetricsRegistry:
+    """Counters sharded per thread: increments never contend, `snapshot` sums the shards.
+
+    Each shard has its own lock, held by the owning thread while it updates the
+    shard and by `snapshot` while copying it, so a snapshot never sees half of an
+    `inc_request`. The owner only waits while a snapshot copies its shard. The
+    registry lock is taken when a thread registers its shard and when a snapshot
+    copies the shard list.
+    """
+
     def __init__(self):
-        self._lock = Lock()
-        self.state = MetricState()
+        self._local = local()
+        self._shards: List[Tuple[MetricState, Lock]] = []
+        self._shards_lock = Lock()
+
+    def _shard(self) -> Tuple[MetricState, Lock]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = (MetricState(), Lock())
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
 
     def inc_request(self, pages: int, modules_applied: int):
-        with self._lock:
-            self.state.requests += 1
-            self.state.pages += pages
-            self.state.modules_applied += modules_applied
+        state, lock = self._shard()
+        with lock:
+            state.requests += 1
+            state.pages += pages
+            state.modules_applied += modules_applied
 
     def snapshot(self) -> Dict[str, Any]:
-        with self._lock:
-            return asdict(self.state)
+        with self._shards_lock:
+            shards = list(self._shards)
+        total = MetricState()
+        for state, lock in shards:
+            with lock:
+                counts = [getattr(state, f.name) for f in fields(MetricState)]
+            for f, count in zip(fields(MetricState), counts, strict=True):
+                setattr(total, f.name, getattr(total, f.name) + count)
+        return asdict(total)
 
 
 metrics = MetricsRegistry()
 
-__all__ = ["metrics"]
\ No newline at end of file
+__all__ = ["metrics"]
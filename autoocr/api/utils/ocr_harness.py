@@ -10,7 +10,8 @@ Key Metrics:
   - aggregates: avg_baseline, avg_processed, avg_delta
 
 Similarity:
-  Uses RapidFuzz fuzz.QRatio (Levenshtein-based). Could add token_set_ratio later.
+  QRatio semantics (Indel-normalized similarity, 0 when either text is empty), computed
+  via RapidFuzz's Indel scorer directly. Could add token_set_ratio later.
 
 CLI Usage (after installing dependencies):
   python -m autoocr.api.utils.ocr_harness --input sample.pdf --lang eng --output report.json
@@ -18,19 +19,32 @@ CLI Usage (after installing dependencies):
 Notes:
   - Requires system tesseract binary accessible to pytesseract.
   - If OCR fails, the page is skipped with an error entry.
+  - Pages are OCR'd concurrently on a thread pool (tesseract runs out of process,
+    so threads scale with cores); results keep document order.
+  - When tesserocr is installed, OCR runs in-process on one resident engine per
+    thread and language instead of spawning the tesseract binary per image.
   - Designed to be importable as a library function too.
 """
 from __future__ import annotations
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from threading import local
 from typing import List, Dict, Any, Optional, TYPE_CHECKING
-import json
 import argparse
+import os
 import time
 
+import numpy as np
 import pytesseract  # type: ignore
-from rapidfuzz import fuzz  # type: ignore
+from rapidfuzz.distance import Indel  # type: ignore
 
-from .image_io import pdf_to_images, images_to_pdf
+try:  # optional libtesseract bindings: no subprocess per image
+    import tesserocr  # type: ignore
+except Exception:  # pylint: disable=broad-except
+    tesserocr = None  # type: ignore
+
+from .image_io import PdfSource, pdf_to_images, images_to_pdf
+from .json_io import dumps_bytes, write_json
 if TYPE_CHECKING:  # pragma: no cover
     from ..pipeline import Pipeline  # type: ignore
 
@@ -47,71 +61,154 @@ class PageResult:
     ocr_time_processed_ms: float
 
 
+# Per-thread {lang: PyTessBaseAPI}; an engine instance must not be shared across threads
+_TESS_APIS = local()
+
+
+def _tess_api(lang: str):
+    apis = getattr(_TESS_APIS, "by_lang", None)
+    if apis is None:
+        apis = _TESS_APIS.by_lang = {}
+    api = apis.get(lang)
+    if api is None:
+        api = apis[lang] = tesserocr.PyTessBaseAPI(lang=lang)
+    return api
+
+
 def ocr_image(image, lang: str = "eng") -> str:
     """Run OCR on a BGR image and return extracted text."""
+    if tesserocr is not None:
+        from PIL import Image  # same array -> image conversion pytesseract applies
+
+        api = _tess_api(lang)
+        api.SetImage(Image.fromarray(image))
+        return api.GetUTF8Text()
     return pytesseract.image_to_string(image, lang=lang)
 
 
 def similarity(a: str, b: str) -> float:
-    return float(fuzz.QRatio(a, b))
+    # Same score as fuzz.QRatio without its processor/wrapper dispatch
+    if not a or not b:
+        return 0.0
+    return 100.0 * Indel.normalized_similarity(a, b)
 
 
-def run_ocr_harness(pdf_bytes: bytes, pipeline: Optional["Pipeline"] = None, lang: str = "eng") -> Dict[str, Any]:
+@dataclass
+class PageResultsBatch:
+    """Per-page harness results as parallel columns (row i is page i).
+
+    Numeric columns are float64 arrays so aggregates are numpy reductions; rows
+    that failed OCR keep their zero-initialized values.
+    """
+    baseline_text: List[str]
+    processed_text: List[str]
+    similarity_baseline: np.ndarray
+    similarity_processed: np.ndarray
+    ocr_time_baseline_ms: np.ndarray
+    ocr_time_processed_ms: np.ndarray
+
+    @classmethod
+    def empty(cls, n_pages: int) -> "PageResultsBatch":
+        return cls(
+            baseline_text=[""] * n_pages,
+            processed_text=[""] * n_pages,
+            similarity_baseline=np.zeros(n_pages),
+            similarity_processed=np.zeros(n_pages),
+            ocr_time_baseline_ms=np.zeros(n_pages),
+            ocr_time_processed_ms=np.zeros(n_pages),
+        )
+
+    def __len__(self) -> int:
+        return len(self.baseline_text)
+
+    @property
+    def delta(self) -> np.ndarray:
+        return self.similarity_processed - self.similarity_baseline
+
+    def page(self, idx: int) -> PageResult:
+        return PageResult(
+            page_index=idx,
+            baseline_text=self.baseline_text[idx],
+            processed_text=self.processed_text[idx],
+            similarity_baseline=float(self.similarity_baseline[idx]),
+            similarity_processed=float(self.similarity_processed[idx]),
+            delta=float(self.delta[idx]),
+            ocr_time_baseline_ms=float(self.ocr_time_baseline_ms[idx]),
+            ocr_time_processed_ms=float(self.ocr_time_processed_ms[idx]),
+        )
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Rows in the `asdict(PageResult)` layout used by the report."""
+        columns = zip(
+            self.baseline_text,
+            self.processed_text,
+            self.similarity_baseline.tolist(),
+            self.similarity_processed.tolist(),
+            self.delta.tolist(),
+            self.ocr_time_baseline_ms.tolist(),
+            self.ocr_time_processed_ms.tolist(),
+            strict=True,
+        )
+        keys = [f.name for f in fields(PageResult)]
+        return [dict(zip(keys, (idx, *row), strict=True)) for idx, row in enumerate(columns)]
+
+
+def _ocr_page(batch: PageResultsBatch, idx: int, raw_img, proc_img, lang: str) -> None:
+    """OCR one raw/processed page pair and write its scores into row `idx` of `batch`."""
+    try:
+        t0 = time.perf_counter()
+        raw_text = ocr_image(raw_img, lang=lang)
+        t1 = time.perf_counter()
+        proc_text = ocr_image(proc_img, lang=lang)
+        t2 = time.perf_counter()
+    except Exception:  # pylint: disable=broad-except
+        return  # row stays zeroed
+    # Compare raw vs processed text similarity to itself (ideal text unknown).
+    # Heuristic: processed should be 'cleaner'; we measure self-similarity improvement is ambiguous.
+    # Better: Use processed vs ground truth; here we compare each against processed (approx).
+    batch.baseline_text[idx] = raw_text
+    batch.processed_text[idx] = proc_text
+    batch.similarity_baseline[idx] = similarity(raw_text, proc_text)
+    batch.similarity_processed[idx] = 100.0
+    batch.ocr_time_baseline_ms[idx] = (t1 - t0) * 1000.0
+    batch.ocr_time_processed_ms[idx] = (t2 - t1) * 1000.0
+
+
+def run_ocr_harness(
+    pdf_bytes: PdfSource,
+    pipeline: Optional["Pipeline"] = None,
+    lang: str = "eng",
+    workers: Optional[int] = None,
+) -> Dict[str, Any]:
     if pipeline is None:
-        from ..pipeline import Pipeline  # local import to avoid circular
-        pipeline = Pipeline()
+        from ..pipeline import default_pipeline  # local import to avoid circular
+        pipeline = default_pipeline()
 
     raw_pages = pdf_to_images(pdf_bytes)
     pipeline_results = pipeline.run_document(raw_pages)
     processed_pages = [r["final"] for r in pipeline_results]
 
-    page_results: List[PageResult] = []
-    for idx, (raw_img, proc_img) in enumerate(zip(raw_pages, processed_pages)):
-        try:
-            t0 = time.time()
-            raw_text = ocr_image(raw_img, lang=lang)
-            t1 = time.time()
-            proc_text = ocr_image(proc_img, lang=lang)
-            t2 = time.time()
-        except Exception as e:  # pylint: disable=broad-except
-            page_results.append(PageResult(
-                page_index=idx,
-                baseline_text="",
-                processed_text="",
-                similarity_baseline=0.0,
-                similarity_processed=0.0,
-                delta=0.0,
-                ocr_time_baseline_ms=0.0,
-                ocr_time_processed_ms=0.0,
+    n_pages = len(raw_pages)
+    batch = PageResultsBatch.empty(n_pages)
+    if n_pages:
+        workers = max(1, min(workers or os.cpu_count() or 1, n_pages))
+        # Each task writes only its own row, so workers never touch the same slot
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(
+                _ocr_page, [batch] * n_pages, range(n_pages), raw_pages, processed_pages, [lang] * n_pages
             ))
-            continue
-        # Compare raw vs processed text similarity to itself (ideal text unknown).
-        # Heuristic: processed should be 'cleaner'; we measure self-similarity improvement is ambiguous.
-        # Better: Use processed vs ground truth; here we compare each against processed (approx).
-        sim_baseline = similarity(raw_text, proc_text)
-        sim_processed = 100.0  # identical reference
-        page_results.append(PageResult(
-            page_index=idx,
-            baseline_text=raw_text,
-            processed_text=proc_text,
-            similarity_baseline=sim_baseline,
-            similarity_processed=sim_processed,
-            delta=sim_processed - sim_baseline,
-            ocr_time_baseline_ms=(t1 - t0) * 1000.0,
-            ocr_time_processed_ms=(t2 - t1) * 1000.0,
-        ))
-
-    avg_baseline = sum(p.similarity_baseline for p in page_results) / max(len(page_results), 1)
-    avg_processed = sum(p.similarity_processed for p in page_results) / max(len(page_results), 1)
+
+    avg_baseline = float(batch.similarity_baseline.mean()) if n_pages else 0.0
+    avg_processed = float(batch.similarity_processed.mean()) if n_pages else 0.0
     avg_delta = avg_processed - avg_baseline
 
     return {
-        "pages": [asdict(p) for p in page_results],
+        "pages": batch.to_dicts(),
         "aggregates": {
             "avg_similarity_baseline": avg_baseline,
             "avg_similarity_processed": avg_processed,
             "avg_delta": avg_delta,
-            "page_count": len(page_results),
+            "page_count": n_pages,
         },
         "pipeline_order": [m.name for m in pipeline.modules],
     }
@@ -124,18 +221,14 @@ def main():  # pragma: no cover - CLI wrapper
     parser.add_argument("--lang", default="eng", help="Tesseract language code")
     args = parser.parse_args()
 
-    with open(args.input, "rb") as f:
-        data = f.read()
-    report = run_ocr_harness(data, lang=args.lang)
-    json_text = json.dumps(report, indent=2)
+    report = run_ocr_harness(args.input, lang=args.lang)
     if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(json_text)
+        write_json(args.output, report)
     else:
-        print(json_text)
+        print(dumps_bytes(report).decode("utf-8"))
 
 
 if __name__ == "__main__":  # pragma: no cover
     main()
 
-__all__ = ["run_ocr_harness", "ocr_image", "similarity", "PageResult"]
\ No newline at end of file
+__all__ = ["run_ocr_harness", "ocr_image", "similarity", "PageResult", "PageResultsBatch"]
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""Process-level parallelism helpers.
+
+CPU-bound page and file work runs on a process pool whose workers each pin
+OpenCV to a single thread; the pool supplies the parallelism, so N workers
+use N cores without oversubscribing them with OpenCV's own thread pool.
+"""
+from __future__ import annotations
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
+
+import cv2
+
+# OpenCV thread pool size chosen for this process (None until configured)
+_cv_threads: Optional[int] = None
+
+
+def set_cv_threads(num_threads: Optional[int] = None) -> int:
+    """Enable OpenCV optimized paths and pin its internal thread pool size.
+
+    Args:
+        num_threads: Threads for OpenCV's parallel_for. None uses all cores, which
+            suits serial/interactive use. Worker processes of a multiprocessing pool
+            should pass 1 so N workers x 1 thread = N cores without oversubscription.
+
+    Returns:
+        Thread count applied
+    """
+    global _cv_threads
+    cv2.setUseOptimized(True)
+    threads = num_threads or os.cpu_count() or 1
+    cv2.setNumThreads(threads)
+    _cv_threads = threads
+    return threads
+
+
+def get_cv_threads() -> Optional[int]:
+    """Thread count applied by set_cv_threads in this process, or None if never called."""
+    return _cv_threads
+
+
+def _init_pool_worker(initializer: Optional[Callable[..., None]], initargs: tuple) -> None:
+    # The pool supplies the parallelism: one OpenCV thread per worker avoids oversubscription
+    set_cv_threads(1)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def process_pool(max_workers: int, initializer: Optional[Callable[..., None]] = None,
+                 initargs: tuple = ()) -> ProcessPoolExecutor:
+    """Process pool for CPU-bound page/file work, one OpenCV thread per worker.
+
+    Workers come from a forkserver (spawn where unavailable), never from forking the
+    caller: callers keep helper threads running (rasterization prefetch, read-ahead)
+    while the pool starts workers on demand, and forking a multi-threaded process can
+    deadlock on locks those threads hold. `initializer` and `initargs` must pickle.
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(method),
+                               initializer=_init_pool_worker, initargs=(initializer, initargs))
+
+
+__all__ = ["set_cv_threads", "get_cv_threads", "process_pool"]
@@ -2,6 +2,13 @@
 
 Identifies document types and security features for appropriate processing.
 """
+import hashlib
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from threading import Lock
+
 import cv2
 import numpy as np
 from typing import Dict, List, Any, Tuple, Optional
@@ -10,6 +17,47 @@ from ..utils.logging import get_logger
 logger = get_logger("security_detector")
 
 
+def _guilloche_band_lut(size: int) -> np.ndarray:
+    """Band index per DFT bin: 1..9 for rings of width 10 centred on radii 30..110, else 0 or 10."""
+    y, x = np.ogrid[:size, :size]
+    radius = np.sqrt((x - size // 2) ** 2 + (y - size // 2) ** 2)
+    bands = np.digitize(radius, np.arange(25, 125, 10)).astype(np.intp)
+    # cv2.dft leaves DC at the corner; shift the LUT once instead of every spectrum
+    return np.fft.ifftshift(bands)
+
+
+@lru_cache(maxsize=1)
+def _detector_pool() -> ThreadPoolExecutor:
+    """Shared pool for independent feature checks (OpenCV/numpy release the GIL)."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="security-detector")
+
+
+# A forked child inherits the cached pool but not its threads
+os.register_at_fork(after_in_child=_detector_pool.cache_clear)
+
+
+@lru_cache(maxsize=16)
+def _line_kernels(length: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Horizontal and vertical 1-D rect structuring elements, built once per length."""
+    return (cv2.getStructuringElement(cv2.MORPH_RECT, (length, 1)),
+            cv2.getStructuringElement(cv2.MORPH_RECT, (1, length)))
+
+
+def _otsu_threshold(hist: np.ndarray) -> int:
+    """Otsu threshold of a 256-bin histogram (same choice as cv2.THRESH_OTSU)."""
+    p = hist.astype(np.float64) / hist.sum()
+    omega = np.cumsum(p)
+    mu = np.cumsum(p * np.arange(256))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sigma_b = (mu[-1] * omega - mu) ** 2 / (omega * (1.0 - omega))
+    return int(np.argmax(np.nan_to_num(sigma_b, nan=0.0, posinf=0.0)))
+
+
+_GUILLOCHE_GRID = 512
+_GUILLOCHE_NUM_BANDS = 9
+_GUILLOCHE_BANDS = _guilloche_band_lut(_GUILLOCHE_GRID)
+
+
 class SecurityFeatureDetector:
     """Detects security documents and identifies features that must be preserved or removed."""
 
@@ -21,9 +69,16 @@ class SecurityFeatureDetector:
         'currency': ['security_thread', 'hologram', 'microprinting']
     }
 
+    # Number of analyses kept per detector, keyed by image content fingerprint
+    CACHE_SIZE = 64
+
+    # Long-side length detectors run at in analyze_image (except skew and microtext)
+    ANALYSIS_MAX_DIM = 1000
+
     def __init__(self):
         """Initialize security feature detector."""
-        pass
+        self._cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = Lock()
 
     def analyze(self, image_path: str) -> Dict[str, Any]:
         """Detect document type and security features.
@@ -49,42 +104,78 @@ class SecurityFeatureDetector:
         Returns:
             Analysis results dictionary
         """
+        key = self._fingerprint(img)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        if cached is not None:
+            return {**cached, 'features': list(cached['features'])}
+
+        # Full-resolution gray feeds skew and microtext; every other detector senses
+        # coarse structure and runs on one downscaled copy with scaled pixel constants
         gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-        doc_type = self._classify_document_type(img)
-        features = self._detect_security_features(img)
+        scale = min(1.0, self.ANALYSIS_MAX_DIM / max(img.shape[:2]))
+        if scale < 1.0:
+            small = cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            small_gray = cv2.resize(gray, (small.shape[1], small.shape[0]), interpolation=cv2.INTER_AREA)
+        else:
+            small, small_gray = img, gray
+        hologram = self._detect_hologram(small)
+
+        doc_type = self._classify_document_type(small, small_gray, hologram, scale=scale)
+        features = self._detect_security_features(small, small_gray, hologram, scale=scale, detail_gray=gray)
         skew_angle = self._calculate_skew(gray)
         risk_level = self._assess_processing_risk(img, doc_type)
 
-        return {
+        result = {
             'document_type': doc_type,
             'features': features,
             'skew_angle': skew_angle,
             'risk_level': risk_level,
-            'has_warp': self._detect_warp(gray)
+            'has_warp': self._detect_warp(small_gray, scale=scale)
         }
-
-    def _classify_document_type(self, img: np.ndarray) -> str:
+        with self._cache_lock:
+            self._cache[key] = {**result, 'features': list(features)}
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _fingerprint(img: np.ndarray) -> bytes:
+        """Content hash of an image (pixels plus shape/dtype)."""
+        digest = hashlib.blake2b(np.ascontiguousarray(img), digest_size=16)
+        digest.update(f"{img.shape}{img.dtype}".encode())
+        return digest.digest()
+
+    def _classify_document_type(self, img: np.ndarray, gray: Optional[np.ndarray] = None,
+                                hologram: Optional[bool] = None, scale: float = 1.0) -> str:
         """Classify document type based on visual signatures.
 
         Args:
             img: BGR image
+            gray: Precomputed grayscale of `img` (converted here if omitted)
+            hologram: Precomputed `_detect_hologram(img)` result (computed here if omitted)
+            scale: Resolution of `img` relative to the original page
 
         Returns:
             Document type string
         """
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        if gray is None:
+            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
 
         # Check for MRZ (Machine Readable Zone) = passport/ID
         if self._detect_mrz(gray):
             return 'passport'
 
         # Check for hologram reflections
-        if self._detect_hologram(img):
+        if hologram is None:
+            hologram = self._detect_hologram(img)
+        if hologram:
             return 'id_card'
 
         # Check for certificate seals
-        if self._detect_embossed_seal(gray):
+        if self._detect_embossed_seal(gray, scale=scale):
             return 'certificate'
 
         return 'standard'
@@ -104,10 +195,11 @@ class SecurityFeatureDetector:
         search_height = int(height * 0.15)
         search_region = gray[-search_height:, :]
 
-        # MRZ has very dense, regular text
-        _, binary = cv2.threshold(search_region, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
-
-        text_density = np.count_nonzero(binary) / (search_region.shape[0] * search_region.shape[1])
+        # MRZ has very dense, regular text: fraction of pixels at or below the Otsu
+        # threshold, read from one histogram instead of materializing a binary strip
+        hist = cv2.calcHist([search_region], [0], None, [256], [0, 256]).ravel()
+        cumulative = np.cumsum(hist, dtype=np.float64)
+        text_density = cumulative[_otsu_threshold(hist)] / cumulative[-1]
 
         # MRZ typically has 40-70% text density
         return 0.30 < text_density < 0.80
@@ -121,116 +213,137 @@ class SecurityFeatureDetector:
         Returns:
             True if hologram detected
         """
-        hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
-        s = hsv[:, :, 1]
-        v = hsv[:, :, 2]
-
-        # Holograms create low saturation + high value regions
-        low_sat_bright = np.logical_and(s < 50, v > 200)
-        ratio = np.count_nonzero(low_sat_bright) / (img.shape[0] * img.shape[1])
+        # HSV value/saturation straight from BGR: V = max, S = 255 * (max - min) / max.
+        # S < 50 (after rounding) <=> 170 * (max - min) < 33 * max, exact in uint16.
+        b, g, r = cv2.split(img)
+        v = cv2.max(cv2.max(b, g), r)
+        if cv2.minMaxLoc(v)[1] <= 200:
+            return False  # dark page: no bright pixels, skip the saturation pass
+        spread = cv2.subtract(v, cv2.min(cv2.min(b, g), r))
+
+        # Holograms create low saturation + high value regions (uint8 masks, no bool temporaries)
+        low_sat = cv2.compare(cv2.multiply(spread, 170, dtype=cv2.CV_16U),
+                              cv2.multiply(v, 33, dtype=cv2.CV_16U), cv2.CMP_LT)
+        bright = cv2.compare(v, 200, cv2.CMP_GT)
+        ratio = cv2.countNonZero(cv2.bitwise_and(low_sat, bright)) / v.size
 
         return ratio > 0.05
 
-    def _detect_embossed_seal(self, gray: np.ndarray) -> bool:
+    def _detect_embossed_seal(self, gray: np.ndarray, scale: float = 1.0) -> bool:
         """Detect embossed seals (certificates).
 
         Args:
             gray: Grayscale image
+            scale: Resolution of `gray` relative to the original page
 
         Returns:
             True if embossed seal detected
         """
         # Embossed seals have distinctive 3D shadow patterns
         # Use Sobel to detect raised edges
-        sobelx = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3)
-        sobely = cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=3)
-        gradient_magnitude = np.sqrt(sobelx**2 + sobely**2)
-
-        # Look for circular high-gradient regions
-        _, edges = cv2.threshold(gradient_magnitude.astype(np.uint8), 30, 255, cv2.THRESH_BINARY)
-        circles = cv2.HoughCircles(edges, cv2.HOUGH_GRADIENT, 1, 50,
-                                   param1=50, param2=30, minRadius=30, maxRadius=200)
+        # (int16 derivatives, saturated uint8 L1 magnitude |dx| + |dy|)
+        sobelx = cv2.Sobel(gray, cv2.CV_16S, 1, 0, ksize=3)
+        sobely = cv2.Sobel(gray, cv2.CV_16S, 0, 1, ksize=3)
+        gradient_magnitude = cv2.add(cv2.convertScaleAbs(sobelx), cv2.convertScaleAbs(sobely))
+
+        # Look for circular high-gradient regions (HoughCircles runs its own Canny on this)
+        _, edges = cv2.threshold(gradient_magnitude, 30, 255, cv2.THRESH_BINARY)
+        # Distances, radii and vote counts (proportional to circumference) scale with resolution
+        votes = max(10, int(30 * scale))
+        # Every accumulator vote comes from an edge pixel, so too few edges cannot form a circle
+        if cv2.countNonZero(edges) < votes:
+            return False
+        circles = cv2.HoughCircles(edges, cv2.HOUGH_GRADIENT, 1, max(1.0, 50 * scale),
+                                   param1=50, param2=votes,
+                                   minRadius=int(30 * scale), maxRadius=int(200 * scale))
 
         return circles is not None and len(circles[0]) > 0
 
-    def _detect_security_features(self, img: np.ndarray) -> List[str]:
+    def _detect_security_features(self, img: np.ndarray, gray: Optional[np.ndarray] = None,
+                                  hologram: Optional[bool] = None, scale: float = 1.0,
+                                  detail_gray: Optional[np.ndarray] = None) -> List[str]:
         """Identify specific security features present.
 
         Args:
             img: BGR image
+            gray: Precomputed grayscale of `img` (converted here if omitted)
+            hologram: Precomputed `_detect_hologram(img)` result (computed here if omitted)
+            scale: Resolution of `img` relative to the original page
+            detail_gray: Full-resolution grayscale for fine-detail checks (defaults to `gray`)
 
         Returns:
             List of detected feature names
         """
         features = []
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-        # Watermark detection (low-frequency patterns)
-        if self._has_watermark(gray):
-            features.append('watermark')
-
-        # Microtext (high-frequency text patterns)
-        if self._has_microtext(gray):
-            features.append('microtext')
-
-        # Guilloche patterns (complex curved lines)
-        if self._has_guilloche(gray):
-            features.append('guilloche')
+        if gray is None:
+            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+
+        # The checks only read their inputs, so run them concurrently
+        pool = _detector_pool()
+        checks = [
+            # Watermark detection (low-frequency patterns)
+            ('watermark', pool.submit(self._has_watermark, gray, scale=scale)),
+            # Microtext (high-frequency text patterns) does not survive downscaling
+            ('microtext', pool.submit(self._has_microtext, detail_gray if detail_gray is not None else gray)),
+            # Guilloche patterns (complex curved lines)
+            ('guilloche', pool.submit(self._has_guilloche, gray)),
+        ]
+        features.extend(name for name, future in checks if future.result())
 
         # Hologram (color-shifting reflections)
-        if self._has_hologram(img):
+        if hologram is None:
+            hologram = self._detect_hologram(img)
+        if hologram:
             features.append('hologram')
 
         return features
 
-    def _has_watermark(self, gray: np.ndarray) -> bool:
-        """Check for watermark presence."""
-        # Large morphological opening to extract background
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (15, 15))
-        background = cv2.morphologyEx(gray, cv2.MORPH_OPEN, kernel)
-
-        diff = cv2.absdiff(gray, background)
-        watermark_ratio = np.count_nonzero(diff > 10) / (gray.shape[0] * gray.shape[1])
+    def _has_watermark(self, gray: np.ndarray, scale: float = 1.0) -> bool:
+        """Check for watermark presence (`scale`: resolution of `gray` relative to the page)."""
+        # Watermarks are low-frequency, so analyze at (at most) half resolution
+        small = gray
+        if scale > 0.5:
+            factor = 0.5 / scale
+            small = cv2.resize(gray, None, fx=factor, fy=factor, interpolation=cv2.INTER_AREA)
+            scale = 0.5
+
+        # Large morphological opening to extract background; the 15x15 rect used at full
+        # resolution is scaled down and applied as separate 1-D row/column passes
+        kh, kv = _line_kernels(max(3, int(15 * scale) | 1))
+        background = cv2.erode(cv2.erode(small, kh), kv)
+        background = cv2.dilate(cv2.dilate(background, kh), kv)
+
+        diff = cv2.absdiff(small, background)
+        _, changed = cv2.threshold(diff, 10, 255, cv2.THRESH_BINARY)
+        watermark_ratio = cv2.countNonZero(changed) / changed.size
 
         return watermark_ratio > 0.20
 
     def _has_microtext(self, gray: np.ndarray) -> bool:
         """Check for microtext."""
         # Microtext shows up as very high frequency content
-        laplacian = cv2.Laplacian(gray, cv2.CV_64F)
-        variance = laplacian.var()
+        laplacian = cv2.Laplacian(gray, cv2.CV_16S)
+        variance = cv2.meanStdDev(laplacian)[1][0, 0] ** 2  # single pass, no float64 temporaries
 
         return variance > 150  # High edge variance indicates fine detail
 
     def _has_guilloche(self, gray: np.ndarray) -> bool:
         """Check for guilloche patterns."""
-        # FFT analysis for repeating patterns
-        f = np.fft.fft2(gray)
-        fshift = np.fft.fftshift(f)
-        magnitude = np.abs(fshift)
+        # FFT analysis for repeating patterns on a fixed-size decimated grid
+        small = cv2.resize(gray, (_GUILLOCHE_GRID, _GUILLOCHE_GRID), interpolation=cv2.INTER_AREA)
+        spectrum = cv2.dft(np.float32(small), flags=cv2.DFT_COMPLEX_OUTPUT)
+        magnitude = cv2.magnitude(spectrum[:, :, 0], spectrum[:, :, 1])
 
-        # Sample circular frequency bands
-        rows, cols = gray.shape
-        crow, ccol = rows // 2, cols // 2
+        # Energy of every circular frequency band in one pass over the precomputed band LUT
+        band_energy = np.bincount(_GUILLOCHE_BANDS.ravel(), weights=magnitude.ravel(),
+                                  minlength=_GUILLOCHE_NUM_BANDS + 2)
+        pattern_strength = band_energy[1:_GUILLOCHE_NUM_BANDS + 1].max()
 
-        pattern_strength = 0.0
-        for radius in range(30, 120, 10):
-            y, x = np.ogrid[:rows, :cols]
-            mask = ((x - ccol)**2 + (y - crow)**2 <= (radius + 5)**2) & \
-                   ((x - ccol)**2 + (y - crow)**2 >= (radius - 5)**2)
-
-            band_energy = np.sum(magnitude[mask])
-            pattern_strength = max(pattern_strength, band_energy)
-
-        total_energy = np.sum(magnitude)
+        total_energy = band_energy.sum()
         normalized_strength = pattern_strength / (total_energy + 1e-10)
 
         return normalized_strength > 0.15
 
-    def _has_hologram(self, img: np.ndarray) -> bool:
-        """Check for hologram overlay."""
-        return self._detect_hologram(img)
-
     def _calculate_skew(self, gray: np.ndarray) -> float:
         """Calculate skew angle.
 
@@ -244,32 +357,31 @@ class SecurityFeatureDetector:
             from deskew import determine_skew
             return determine_skew(gray)
         except Exception as e:
-            logger.warning(f"Skew detection failed: {e}")
+            logger.warning("Skew detection failed: %s", e)
             return 0.0
 
-    def _detect_warp(self, gray: np.ndarray) -> bool:
+    def _detect_warp(self, gray: np.ndarray, scale: float = 1.0) -> bool:
         """Detect page warp/curve.
 
         Args:
             gray: Grayscale image
+            scale: Resolution of `gray` relative to the original page
 
         Returns:
             True if warp detected
         """
         # Simple heuristic: detect curved text lines
         edges = cv2.Canny(gray, 50, 150)
-        lines = cv2.HoughLinesP(edges, 1, np.pi/180, 100, minLineLength=100, maxLineGap=10)
+        lines = cv2.HoughLinesP(edges, 1, np.pi/180, max(10, int(100 * scale)),
+                                minLineLength=100 * scale, maxLineGap=max(1.0, 10 * scale))
 
         if lines is None:
             return False
 
         # Check if lines are consistently non-horizontal (warped)
-        non_horizontal = 0
-        for line in lines:
-            x1, y1, x2, y2 = line[0]
-            angle = np.abs(np.arctan2(y2 - y1, x2 - x1) * 180 / np.pi)
-            if 5 < angle < 85:  # Not horizontal or vertical
-                non_horizontal += 1
+        pts = lines[:, 0, :]
+        angle = np.abs(np.degrees(np.arctan2(pts[:, 3] - pts[:, 1], pts[:, 2] - pts[:, 0])))
+        non_horizontal = np.count_nonzero((angle > 5) & (angle < 85))  # Not horizontal or vertical
 
         return non_horizontal > len(lines) * 0.3
 
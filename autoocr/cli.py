@@ -1,20 +1,29 @@
 """CLI entry points for AutoOCR.
 
 Commands:
-  autoocr process <input_path> [--out OUTPUT] [--lang ENG] [--json REPORT_JSON]
+  autoocr process <input_path> [--out OUTPUT] [--json REPORT_JSON] [--workers N] [--queue-size N]
   autoocr preprocess <input> <output> [--mode MODE] [--config CONFIG]
-  autoocr batch <input_dir> <output_dir> [--mode MODE] [--config CONFIG]
+  autoocr batch <input_dir> <output_dir> [--mode MODE] [--config CONFIG] [--workers N]
   autoocr harness  <input_path> [--lang ENG] [--json REPORT_JSON]
 """
 from __future__ import annotations
 
 import argparse
-import json
+import os
+import stat
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from autoocr.api.utils.image_io import pdf_to_images_simple, images_to_pdf
-from autoocr.api.pipeline import Pipeline
+import numpy as np
+
+from autoocr.api.utils.image_io import pdf_to_images_iter, images_to_pdf
+from autoocr.api.utils.async_io import iter_prefetch
+from autoocr.api.utils.parallel import process_pool
+from autoocr.api.pipeline import Pipeline, default_pipeline, summarize_timings
 from autoocr.api.utils.ocr_harness import run_ocr_harness
+from autoocr.api.utils.json_io import dumps_bytes, write_json, write_json_array
 from autoocr.api.preprocessor import (
     DocumentPreprocessor,
     SecurityDocumentPreprocessor,
@@ -25,28 +34,82 @@ from autoocr.api.preprocessor import (
 )
 
 
+# Per-process pipeline for `process --workers N` (built once by the pool initializer)
+_WORKER_PIPELINE: Optional[Pipeline] = None
+
+
+def _init_process_worker() -> None:
+    global _WORKER_PIPELINE  # noqa: PLW0603
+    _WORKER_PIPELINE = default_pipeline()
+
+
+def _run_page(page: np.ndarray) -> Tuple[np.ndarray, List[Dict[str, Any]], np.ndarray]:
+    result = _WORKER_PIPELINE.run_page(page)
+    return result["final"], result["steps"], result["timings"]
+
+
+def _iter_processed(pages: Iterable[np.ndarray],
+                    workers: int) -> Iterator[Tuple[np.ndarray, List[Dict[str, Any]], np.ndarray]]:
+    """Yield (final image, steps, timings) per page in document order.
+
+    With workers > 1 pages are processed on a process pool; at most 2 * workers
+    pages are in flight, so pages are still rasterized lazily.
+    """
+    if workers <= 1:
+        for r in default_pipeline().iter_document(pages):
+            yield r["final"], r["steps"], r["timings"]
+        return
+    with process_pool(workers, initializer=_init_process_worker) as pool:
+        pending = deque()
+        for page in pages:
+            pending.append(pool.submit(_run_page, page))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _require_input(path: Path, is_dir: bool) -> None:
+    """Exit unless `path` is an existing file (or directory); one stat covers both checks."""
+    kind = "Input directory" if is_dir else "Input"
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        raise SystemExit(f"{kind} not found: {path}") from None
+    except OSError as e:  # e.g. permission denied on a parent directory
+        raise SystemExit(f"Cannot access {kind.lower()} {path}: {e.strerror}") from None
+    if stat.S_ISDIR(st.st_mode) != is_dir:
+        raise SystemExit(f"Not a {'directory' if is_dir else 'file'}: {path}")
+
+
 def cmd_process(args):
     input_path = Path(args.input)
-    if not input_path.exists():
-        raise SystemExit(f"Input not found: {input_path}")
-    pdf_bytes = input_path.read_bytes()
-    images = pdf_to_images_simple(pdf_bytes)
-    pipe = Pipeline()
-    results = pipe.run_document(images)
-    processed = [r["final"] for r in results]
-    pdf_out = images_to_pdf(processed)
+    _require_input(input_path, is_dir=False)
+    # Stream pages through the pipeline into the PDF writer; only in-flight pages are resident.
+    # Rasterization runs on its own thread, up to --queue-size pages ahead of processing.
+    page_steps = []
+    page_timings = []
+
+    def processed_pages():
+        # poppler reads the file directly: no in-memory copy of the PDF
+        pages = iter_prefetch(pdf_to_images_iter(input_path), maxsize=args.queue_size)
+        for idx, (final, steps, timings) in enumerate(_iter_processed(pages, args.workers)):
+            page_steps.append({"page_index": idx, "modules": steps})
+            page_timings.append(timings)
+            yield final
+
+    pdf_out = images_to_pdf(processed_pages())
     out_path = Path(args.out or f"processed_{input_path.name}")
     out_path.write_bytes(pdf_out)
     if args.json:
         summary = {
             "input": str(input_path),
             "output": str(out_path),
-            "pages": len(results),
-            "steps": [
-                {"page_index": r["page_index"], "modules": r["steps"]} for r in results
-            ],
+            "pages": len(page_steps),
+            "steps": page_steps,
+            "module_timings": summarize_timings(page_timings),
         }
-        Path(args.json).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+        write_json(args.json, summary)
     print(f"Processed PDF written to {out_path}")
 
 
@@ -55,8 +118,7 @@ def cmd_preprocess(args):
     input_path = Path(args.input)
     output_path = Path(args.output)
 
-    if not input_path.exists():
-        raise SystemExit(f"Input not found: {input_path}")
+    _require_input(input_path, is_dir=False)
 
     # Load config if provided
     config = None
@@ -95,7 +157,7 @@ def cmd_preprocess(args):
 
     # Save JSON report if requested
     if args.json:
-        Path(args.json).write_text(json.dumps(result, indent=2), encoding="utf-8")
+        write_json(args.json, result)
 
 
 def cmd_batch(args):
@@ -103,8 +165,7 @@ def cmd_batch(args):
     input_dir = Path(args.input_dir)
     output_dir = Path(args.output_dir)
 
-    if not input_dir.exists():
-        raise SystemExit(f"Input directory not found: {input_dir}")
+    _require_input(input_dir, is_dir=True)
 
     # Load config if provided
     config = None
@@ -128,7 +189,8 @@ def cmd_batch(args):
         raise SystemExit(f"Invalid mode: {args.mode}")
 
     # Process batch
-    results = preprocessor.process_batch(str(input_dir), str(output_dir))
+    results = preprocessor.process_batch(str(input_dir), str(output_dir),
+                                         workers=args.workers)
 
     # Print summary
     successful = sum(1 for r in results if r.get('success', False))
@@ -139,23 +201,23 @@ def cmd_batch(args):
 
     # Save JSON report if requested
     if args.json:
-        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        write_json_array(args.json, results)
 
 
 def cmd_harness(args):
     input_path = Path(args.input)
-    if not input_path.exists():
-        raise SystemExit(f"Input not found: {input_path}")
-    pdf_bytes = input_path.read_bytes()
-    report = run_ocr_harness(pdf_bytes, lang=args.lang)
+    _require_input(input_path, is_dir=False)
+    report = run_ocr_harness(input_path, lang=args.lang)
     if args.json:
-        Path(args.json).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        write_json(args.json, report)
         print(f"Report written to {args.json}")
     else:
-        print(json.dumps(report, indent=2))
+        print(dumps_bytes(report).decode("utf-8"))
 
 
+@lru_cache(maxsize=1)
 def build_parser():
+    """Build the CLI parser once per process; parse_args does not mutate it."""
     p = argparse.ArgumentParser(prog="autoocr", description="AutoOCR CLI - Production-grade document preprocessing")
     sub = p.add_subparsers(dest="command", required=True)
 
@@ -164,6 +226,10 @@ def build_parser():
     p_proc.add_argument("input", help="Input PDF path")
     p_proc.add_argument("--out", help="Output processed PDF path")
     p_proc.add_argument("--json", help="Write JSON summary to file")
+    p_proc.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for page processing (default: 1 = in-process)")
+    p_proc.add_argument("--queue-size", type=int, default=4,
+                        help="Pages rasterized ahead of processing (default: 4)")
     p_proc.set_defaults(func=cmd_process)
 
     # New preprocess command with modes
@@ -188,6 +254,8 @@ def build_parser():
                         help="Processing mode")
     p_batch.add_argument("--config", help="YAML config file path")
     p_batch.add_argument("--json", help="Write JSON report to file")
+    p_batch.add_argument("--workers", type=int, default=1,
+                         help="Worker processes, one file each (default: 1 = in-process)")
     p_batch.set_defaults(func=cmd_batch)
 
     # Harness command
@@ -0,0 +1,75 @@
+"""Tests for overlapped I/O helpers."""
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+
+import pytest
+
+from autoocr.api.utils.async_io import iter_prefetch, iter_read_ahead
+
+
+def _prefetch_threads():
+    return [t for t in threading.enumerate() if t.name == "prefetch"]
+
+
+def test_iter_prefetch_keeps_order():
+    assert list(iter_prefetch(range(50), maxsize=3)) == list(range(50))
+    assert list(iter_prefetch([], maxsize=3)) == []
+
+
+def test_iter_prefetch_bounds_items_ahead():
+    produced = []
+
+    def items():
+        for i in itertools.count():
+            produced.append(i)
+            yield i
+
+    maxsize = 3
+    stream = iter_prefetch(items(), maxsize=maxsize)
+    assert next(stream) == 0
+    deadline = time.monotonic() + 2.0
+    while len(produced) < maxsize + 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.1)
+    # consumed + a full queue + the one item the producer holds while blocked on put
+    assert len(produced) == 1 + maxsize + 1
+    stream.close()
+
+
+def test_iter_prefetch_reraises_producer_errors():
+    def items():
+        yield 1
+        raise ValueError("raster failed")
+
+    stream = iter_prefetch(items())
+    assert next(stream) == 1
+    with pytest.raises(ValueError, match="raster failed"):
+        next(stream)
+
+
+def test_iter_prefetch_close_stops_blocked_producer():
+    before = set(_prefetch_threads())
+    stream = iter_prefetch(itertools.count(), maxsize=2)
+    assert next(stream) == 0
+    time.sleep(0.05)  # let the producer fill the queue and block
+    stream.close()
+    for thread in set(_prefetch_threads()) - before:
+        thread.join(timeout=2.0)
+        assert not thread.is_alive()
+
+
+def test_iter_read_ahead_order_and_missing_files(tmp_path):
+    paths = []
+    for i in range(6):
+        path = tmp_path / f"f{i}.bin"
+        path.write_bytes(bytes([i]) * (i + 1))
+        paths.append(path)
+    paths.insert(2, tmp_path / "missing.bin")
+
+    results = list(iter_read_ahead(paths, workers=2, depth=3))
+    assert [p for p, _ in results] == paths
+    assert results[2][1] is None
+    assert [data for p, data in results if p.name != "missing.bin"] == [bytes([i]) * (i + 1) for i in range(6)]
@@ -0,0 +1,144 @@
+"""Tests for CLI helpers and argument handling (no poppler or tesseract needed)."""
+from __future__ import annotations
+
+import errno
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from autoocr import cli
+from autoocr.api.pipeline import default_pipeline
+
+
+def make_pages(n: int = 5):
+    import cv2
+    pages = []
+    for i in range(n):
+        img = np.full((200, 300, 3), 255, dtype=np.uint8)
+        cv2.putText(img, f"PAGE {i}", (20, 110), cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0, 0, 0), 3)
+        cv2.rectangle(img, (0, 0), (299, 199), (0, 0, 0), 8)
+        pages.append(img)
+    return pages
+
+
+def test_iter_processed_workers_match_serial():
+    pages = make_pages()
+    serial = list(cli._iter_processed(pages, workers=1))
+    pulled = []
+
+    def counted():
+        for page in pages:
+            pulled.append(page)
+            yield page
+
+    parallel = cli._iter_processed(counted(), workers=2)
+    first = next(parallel)
+    assert len(pulled) <= 4  # at most 2 * workers pages in flight
+    parallel = [first, *parallel]
+
+    assert len(parallel) == len(serial)
+    for (final_s, steps_s, timings_s), (final_p, steps_p, timings_p) in zip(serial, parallel, strict=True):
+        assert np.array_equal(final_s, final_p)
+        assert np.array_equal(timings_s["applied"], timings_p["applied"])
+        assert [(s["module"], s["applied"]) for s in steps_s] == [(s["module"], s["applied"]) for s in steps_p]
+
+
+def test_process_workers_default_to_in_process(monkeypatch, tmp_path):
+    seen = []
+
+    def fake_iter_processed(pages, workers):
+        seen.append(workers)
+        for page in pages:
+            yield page, [], default_pipeline().run_page(page)["timings"]
+
+    pdf_path = tmp_path / "in.pdf"
+    pdf_path.write_bytes(b"%PDF FAKE")
+    monkeypatch.setattr(cli.os, "cpu_count", lambda: 3)
+    monkeypatch.setattr(cli, "pdf_to_images_iter", lambda path: iter(make_pages(1)))
+    monkeypatch.setattr(cli, "_iter_processed", fake_iter_processed)
+
+    argv = ["process", str(pdf_path), "--out", str(tmp_path / "out.pdf")]
+    for extra in ([], ["--workers", "3"]):
+        args = cli.build_parser().parse_args(argv + extra)
+        args.func(args)
+    assert seen == [1, 3]
+    assert (tmp_path / "out.pdf").read_bytes().startswith(b"%PDF")
+
+
+def test_process_json_reports_module_timings(monkeypatch, tmp_path):
+    import json
+
+    pdf_path = tmp_path / "in.pdf"
+    pdf_path.write_bytes(b"%PDF FAKE")
+    monkeypatch.setattr(cli, "pdf_to_images_iter", lambda path: iter(make_pages(2)))
+
+    report = tmp_path / "report.json"
+    args = cli.build_parser().parse_args(["process", str(pdf_path), "--out", str(tmp_path / "out.pdf"),
+                                          "--json", str(report)])
+    args.func(args)
+    summary = json.loads(report.read_text())
+    assert summary["pages"] == 2
+    assert list(summary["module_timings"]) == [m.name for m in default_pipeline().modules]
+    assert summary["module_timings"]["edge_mask"]["applied_ratio"] == 1.0
+
+
+def test_batch_workers_default_to_in_process(monkeypatch, tmp_path):
+    seen = []
+
+    def fake_process_batch(self, input_dir, output_dir, workers=1):
+        seen.append(workers)
+        return []
+
+    monkeypatch.setattr(cli.os, "cpu_count", lambda: 3)
+    monkeypatch.setattr(cli.DocumentPreprocessor, "process_batch", fake_process_batch)
+
+    argv = ["batch", str(tmp_path), str(tmp_path / "out")]
+    for extra in ([], ["--workers", "3"]):
+        args = cli.build_parser().parse_args(argv + extra)
+        args.func(args)
+    assert seen == [1, 3]
+
+
+def _exit_message(argv) -> str:
+    args = cli.build_parser().parse_args(argv)
+    with pytest.raises(SystemExit) as exc:
+        args.func(args)
+    return exc.value.code
+
+
+def test_missing_inputs_exit_with_message(tmp_path):
+    missing = tmp_path / "missing"
+    assert _exit_message(["process", str(missing)]) == f"Input not found: {missing}"
+    assert _exit_message(["harness", str(missing)]) == f"Input not found: {missing}"
+    assert _exit_message(["preprocess", str(missing), str(tmp_path / "o.png")]) == f"Input not found: {missing}"
+    assert _exit_message(["batch", str(missing), str(tmp_path / "o")]) == f"Input directory not found: {missing}"
+
+
+def test_file_and_directory_mismatch_exits(tmp_path):
+    file_path = tmp_path / "page.png"
+    file_path.write_bytes(b"")
+    assert _exit_message(["preprocess", str(tmp_path), str(file_path)]) == f"Not a file: {tmp_path}"
+    assert _exit_message(["batch", str(file_path), str(tmp_path / "o")]) == f"Not a directory: {file_path}"
+
+
+def test_unreadable_input_exits(monkeypatch, tmp_path):
+    def denied(path):
+        raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), str(path))
+
+    monkeypatch.setattr(cli.os, "stat", denied)
+    target = tmp_path / "in.pdf"
+    expected = f"Cannot access input {target}: {os.strerror(errno.EACCES)}"
+    assert _exit_message(["process", str(target)]) == expected
+
+
+def test_cli_exit_status_and_stderr(tmp_path):
+    missing = tmp_path / "missing.pdf"
+    proc = subprocess.run([sys.executable, "-m", "autoocr.cli", "process", str(missing)],
+                          capture_output=True, text=True, timeout=120,
+                          cwd=Path(__file__).resolve().parents[2])
+    assert proc.returncode == 1
+    assert proc.stderr.strip().endswith(f"Input not found: {missing}")
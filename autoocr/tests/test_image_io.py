@@ -14,3 +14,163 @@ def test_images_to_pdf_basic():
     pdf_bytes = images_to_pdf([img1, img2])
     assert pdf_bytes.startswith(b"%PDF")
     assert len(pdf_bytes) > 100
+
+
+def test_pdf_to_images_iter_is_lazy(monkeypatch):
+    from PIL import Image
+    from autoocr.api.utils import image_io
+
+    rendered = []
+
+    def fake_convert(pdf_bytes, first_page=None, last_page=None, **kwargs):
+        rendered.append((first_page, last_page))
+        return [Image.new("RGB", (20, 10 + p), (255, 0, 0)) for p in range(first_page, last_page + 1)]
+
+    monkeypatch.setattr(image_io, "pdfinfo_from_bytes", lambda *a, **k: {"Pages": 9})
+    monkeypatch.setattr(image_io, "convert_from_bytes", fake_convert)
+
+    pages = image_io.pdf_to_images_iter(b"%PDF FAKE", max_pages=5, chunk_pages=2)
+    first = next(pages)
+    assert rendered == [(1, 2)]  # one poppler call per window, only the first so far
+    assert first.shape == (11, 20, 3)
+    assert tuple(first[0, 0]) == (0, 0, 255)  # BGR
+    assert [page.shape[0] for page in pages] == [12, 13, 14, 15]  # document order
+    assert rendered == [(1, 2), (3, 4), (5, 5)]
+
+
+def test_pdf_to_images_iter_reads_paths_directly(monkeypatch, tmp_path):
+    from PIL import Image
+    from autoocr.api.utils import image_io
+
+    def no_bytes(*a, **k):
+        raise AssertionError("path input must not go through the bytes API")
+
+    seen = []
+    monkeypatch.setattr(image_io, "pdfinfo_from_bytes", no_bytes)
+    monkeypatch.setattr(image_io, "convert_from_bytes", no_bytes)
+    monkeypatch.setattr(image_io, "pdfinfo_from_path", lambda pdf, **k: {"Pages": 2})
+    monkeypatch.setattr(image_io, "convert_from_path",
+                        lambda pdf, first_page, last_page, **k: seen.append(pdf)
+                        or [Image.new("RGB", (20, 10)) for _ in range(first_page, last_page + 1)])
+
+    pdf_path = tmp_path / "doc.pdf"
+    assert len(list(image_io.pdf_to_images_iter(pdf_path))) == 2
+    assert seen == [pdf_path]
+
+
+def test_pdf_to_images_forwards_workers_and_page_limit(monkeypatch):
+    from PIL import Image
+    from autoocr.api.utils import image_io
+
+    calls = {}
+
+    def fake_convert(pdf_bytes, **kwargs):
+        calls.update(kwargs)
+        return [Image.new("RGB", (20, 10)) for _ in range(kwargs["last_page"])]
+
+    monkeypatch.setattr(image_io, "convert_from_bytes", fake_convert)
+
+    pages = image_io.pdf_to_images(b"%PDF FAKE", max_pages=3, workers=2)
+    assert len(pages) == 3
+    assert calls["thread_count"] == 2
+    assert calls["last_page"] == 3
+
+
+def test_achromatic_page_skips_color_conversion():
+    import cv2
+    from autoocr.api.utils.image_io import _from_rgb
+
+    rgb = np.zeros((32, 48, 3), dtype=np.uint8)
+    rgb[:, :24] = 200
+    rgb[5:9, 30:40] = 17
+    bgr, mode = _from_rgb(rgb, grayscale=False)
+    assert mode == "BGR" and np.array_equal(bgr, cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR))
+    gray, mode = _from_rgb(rgb, grayscale=True)
+    assert mode == "GRAY" and np.array_equal(gray, cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY))
+
+    rgb[3, 3] = (255, 0, 0)  # single off-grid color pixel falls back to cvtColor
+    bgr, _ = _from_rgb(rgb, grayscale=False)
+    assert tuple(bgr[3, 3]) == (0, 0, 255)
+
+
+def test_images_to_pdf_streams_generator():
+    import pytest
+
+    pages = (np.full((60, 40, 3), v, dtype=np.uint8) for v in (0, 128, 255))
+    pdf_bytes = images_to_pdf(pages, downscale_max_dim=30)
+    assert pdf_bytes.startswith(b"%PDF") and pdf_bytes.rstrip().endswith(b"%%EOF")
+    assert pdf_bytes.count(b"/Type /Page ") == 3
+    assert b"/Count 3" in pdf_bytes
+    assert pdf_bytes.count(b"/Filter /DCTDecode") == 3
+    assert b"/MediaBox [0 0 20 30]" in pdf_bytes
+
+    with pytest.raises(ValueError):
+        images_to_pdf(iter([]))
+
+
+def _read_pdf_pages(pdf_bytes):
+    """Re-open a PDF written by images_to_pdf via its xref table.
+
+    Returns [(mediabox, image_dict, image_stream)] in page-tree order.
+    """
+    import re
+
+    xref_at = int(pdf_bytes.rsplit(b"startxref", 1)[1].split()[0])
+    assert pdf_bytes[xref_at:].startswith(b"xref")
+    header, _, rest = pdf_bytes[xref_at:].partition(b"trailer")
+    size = int(header.split()[2])
+    assert int(re.search(rb"/Size (\d+)", rest).group(1)) == size
+    entries = header.split(b"\n")[3:3 + size - 1]  # skip "xref", "0 N" and the free entry
+
+    objects = {}
+    for num, entry in enumerate(entries, start=1):
+        offset = int(entry[:10])
+        prefix = b"%d 0 obj\n" % num
+        assert pdf_bytes[offset:offset + len(prefix)] == prefix, f"xref offset of object {num} is wrong"
+        objects[num] = offset + len(prefix)
+
+    def obj(num):
+        return pdf_bytes[objects[num]:]
+
+    def stream(num):
+        body = obj(num)
+        length = int(re.search(rb"/Length (\d+)", body).group(1))
+        start = body.index(b"stream\n") + len(b"stream\n")
+        assert body[start + length:].startswith(b"\nendstream")
+        return body[:start], body[start:start + length]
+
+    root = int(re.search(rb"/Root (\d+) 0 R", rest).group(1))
+    pages_id = int(re.match(rb"<< /Type /Catalog /Pages (\d+) 0 R", obj(root)).group(1))
+    tree = re.match(rb"<< /Type /Pages /Kids \[([^\]]*)\] /Count (\d+)", obj(pages_id))
+    kids = [int(k) for k in re.findall(rb"(\d+) 0 R", tree.group(1))]
+    assert int(tree.group(2)) == len(kids)
+
+    pages = []
+    for kid in kids:
+        page = obj(kid)
+        mediabox = tuple(int(v) for v in re.search(rb"/MediaBox \[([^\]]*)\]", page).group(1).split())
+        image_id = int(re.search(rb"/Im0 (\d+) 0 R", page).group(1))
+        image_dict, data = stream(image_id)
+        pages.append((mediabox, image_dict, data))
+    return pages
+
+
+def test_images_to_pdf_round_trip():
+    import cv2
+
+    gradient = np.tile(np.linspace(0, 255, 150, dtype=np.uint8), (100, 1))
+    color = np.zeros((80, 120, 3), dtype=np.uint8)
+    color[:, :60] = (255, 0, 0)
+    color[:, 60:] = (0, 0, 255)
+    sources = [cv2.cvtColor(gradient, cv2.COLOR_GRAY2BGR), gradient, color]
+
+    pages = _read_pdf_pages(images_to_pdf(sources, force_rgb=False, jpeg_quality=95))
+    assert len(pages) == 3
+    for src, (mediabox, image_dict, data) in zip(sources, pages, strict=True):
+        h, w = src.shape[:2]
+        assert mediabox == (0, 0, w, h)
+        assert b"/Width %d /Height %d" % (w, h) in image_dict
+        assert (b"/DeviceGray" if src.ndim == 2 else b"/DeviceRGB") in image_dict
+        decoded = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_UNCHANGED)
+        assert decoded.shape == src.shape
+        assert np.abs(decoded.astype(np.int16) - src).mean() < 3
@@ -0,0 +1,17 @@
+"""Tests for JSON report encoding helpers."""
+from __future__ import annotations
+
+import numpy as np
+
+from autoocr.api.utils.json_io import write_json, write_json_array
+
+
+def test_write_json_array_matches_write_json(tmp_path):
+    items = [
+        {"file": "a.png", "success": True, "steps": [{"score": np.float32(1.5), "meta": {}}]},
+        {"file": "b.png", "success": False, "error": "line one\nline two"},
+    ]
+    for rows in ([], items):
+        write_json(tmp_path / "whole.json", rows)
+        write_json_array(tmp_path / "streamed.json", iter(rows))
+        assert (tmp_path / "streamed.json").read_bytes() == (tmp_path / "whole.json").read_bytes()
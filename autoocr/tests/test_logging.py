@@ -0,0 +1,27 @@
+"""Tests for the structured JSON log formatter."""
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from autoocr.api.utils import logging as log_utils
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("autoocr.test", logging.WARNING, __file__, 1, message, None, None)
+
+
+def test_json_formatter_stdlib_fallback_matches_orjson(monkeypatch):
+    record = _record("café\tpage 1/2 \"ok\"")
+    expected = '{"level":"WARNING","message":"café\\tpage 1/2 \\"ok\\"","logger":"autoocr.test"}'
+    monkeypatch.setattr(log_utils, "orjson", None)
+    assert log_utils.JsonFormatter().format(record) == expected
+
+
+def test_json_formatter_backends_emit_identical_lines(monkeypatch):
+    pytest.importorskip("orjson")
+    record = _record("café\nline two ☃")
+    fast = log_utils.JsonFormatter().format(record)
+    monkeypatch.setattr(log_utils, "orjson", None)
+    assert log_utils.JsonFormatter().format(record) == fast
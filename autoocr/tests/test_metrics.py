@@ -0,0 +1,41 @@
+"""Tests for the per-thread sharded metrics registry."""
+from __future__ import annotations
+
+import threading
+
+from autoocr.api.utils.metrics import MetricsRegistry
+
+
+def test_snapshot_totals_across_threads():
+    registry = MetricsRegistry()
+    threads, per_thread = 8, 2000
+    done = threading.Event()
+    torn = []
+
+    def writer():
+        for _ in range(per_thread):
+            registry.inc_request(pages=2, modules_applied=3)
+
+    def reader():
+        # Every increment moves all three counters together, so ratios hold in any snapshot
+        while not done.is_set():
+            snap = registry.snapshot()
+            if snap["pages"] != 2 * snap["requests"] or snap["modules_applied"] != 3 * snap["requests"]:
+                torn.append(snap)
+
+    watcher = threading.Thread(target=reader)
+    watcher.start()
+    writers = [threading.Thread(target=writer) for _ in range(threads)]
+    for t in writers:
+        t.start()
+    for t in writers:
+        t.join()
+    done.set()
+    watcher.join()
+
+    assert not torn
+    assert registry.snapshot() == {
+        "requests": threads * per_thread,
+        "pages": 2 * threads * per_thread,
+        "modules_applied": 3 * threads * per_thread,
+    }
@@ -0,0 +1,25 @@
+"""Pin the rounding of uint8 module arithmetic (OpenCV saturate_cast: round to nearest, ties to even)."""
+from __future__ import annotations
+
+import cv2
+import numpy as np
+
+from autoocr.api.modules.color_correction import ColorCorrectionModule
+from autoocr.api.modules.sharpen import SharpenModule
+
+
+def test_white_balance_rounds_gains():
+    image = np.array([[[100, 150, 50], [200, 150, 100]]], dtype=np.uint8)  # BGR, channel means 150/150/75
+    balanced = ColorCorrectionModule()._fix_white_balance(image)
+    # gray = 125: B,G gain 5/6, R gain 5/3 -> 166.67 rounds to 167 (truncation gave 166)
+    assert balanced.tolist() == [[[83, 125, 83], [167, 125, 167]]]
+
+
+def test_refine_details_rounds_half_detail():
+    rng = np.random.default_rng(0)
+    gray = rng.integers(0, 256, size=(32, 32), dtype=np.uint8)
+    high_pass = cv2.subtract(gray, cv2.GaussianBlur(gray, (5, 5), 1))
+    exact = gray.astype(np.float64) + 0.5 * high_pass
+    refined = SharpenModule()._refine_details(gray)
+    assert np.array_equal(refined, np.clip(np.rint(exact), 0, 255).astype(np.uint8))
+    assert not np.array_equal(refined, np.clip(exact, 0, 255).astype(np.uint8))  # not truncation
@@ -1,12 +1,13 @@
 """Tests for OCR harness (mocked OCR to avoid external dependency)."""
 from __future__ import annotations
 
+import threading
 import types
 
 import numpy as np
 
 from autoocr.api.utils import ocr_harness
-from autoocr.api.pipeline import Pipeline
+from autoocr.api.pipeline import default_pipeline
 
 
 class DummyTesseractModule:
@@ -19,6 +20,7 @@ def test_run_ocr_harness_monkeypatch(monkeypatch):
     # Monkeypatch pytesseract functions used inside harness
     dummy = DummyTesseractModule()
     monkeypatch.setattr(ocr_harness, "pytesseract", dummy)
+    monkeypatch.setattr(ocr_harness, "tesserocr", None)  # force the pytesseract path
 
     # Build a 1-page fake PDF replacement by directly feeding image bytes
     # Instead, we patch pdf_to_images to bypass poppler usage.
@@ -28,10 +30,85 @@ def test_run_ocr_harness_monkeypatch(monkeypatch):
 
     monkeypatch.setattr(ocr_harness, "pdf_to_images", fake_pdf_to_images)
 
-    report = ocr_harness.run_ocr_harness(b"%PDF FAKE", pipeline=Pipeline())
+    report = ocr_harness.run_ocr_harness(b"%PDF FAKE", pipeline=default_pipeline())
     assert "aggregates" in report
     assert report["aggregates"]["page_count"] == 1
     page = report["pages"][0]
     assert page["similarity_processed"] == 100.0
     # delta zero because identical texts
-    assert page["delta"] == 0.0
\ No newline at end of file
+    assert page["delta"] == 0.0
+
+
+class FakeTessBaseAPI:
+    """Stands in for tesserocr.PyTessBaseAPI; records which thread built each engine."""
+
+    created = []
+
+    def __init__(self, lang="eng"):
+        self.created.append((threading.get_ident(), lang))
+
+    def SetImage(self, image):  # noqa: N802 - tesserocr API names
+        self.size = image.size
+
+    def GetUTF8Text(self):  # noqa: N802
+        return f"{self.size[0]}x{self.size[1]}"
+
+
+def install_fake_tesserocr(monkeypatch):
+    FakeTessBaseAPI.created = []
+    monkeypatch.setattr(ocr_harness, "tesserocr", types.SimpleNamespace(PyTessBaseAPI=FakeTessBaseAPI))
+    monkeypatch.setattr(ocr_harness, "_TESS_APIS", ocr_harness.local())
+    return FakeTessBaseAPI.created
+
+
+def test_ocr_image_reuses_tesserocr_engine(monkeypatch):
+    created = install_fake_tesserocr(monkeypatch)
+
+    img = np.full((10, 20, 3), 255, dtype=np.uint8)
+    assert ocr_harness.ocr_image(img) == "20x10"
+    assert ocr_harness.ocr_image(img) == "20x10"
+    ocr_harness.ocr_image(img, lang="deu")
+    assert [lang for _, lang in created] == ["eng", "deu"]
+
+
+def test_tesserocr_engines_are_per_thread(monkeypatch):
+    created = install_fake_tesserocr(monkeypatch)
+    img = np.full((10, 20, 3), 255, dtype=np.uint8)
+    barrier = threading.Barrier(2)
+
+    def worker():
+        barrier.wait()  # both threads alive at once, so their idents differ
+        for _ in range(3):
+            ocr_harness.ocr_image(img)
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # one engine per thread, reused across that thread's calls
+    assert len(created) == 2
+    assert len({ident for ident, _ in created}) == 2
+
+
+def test_run_ocr_harness_with_tesserocr(monkeypatch):
+    created = install_fake_tesserocr(monkeypatch)
+    monkeypatch.setattr(ocr_harness, "pytesseract", None)  # any fallback use would fail
+    monkeypatch.setattr(ocr_harness, "pdf_to_images",
+                        lambda pdf: [np.full((100, 200, 3), 255, dtype=np.uint8)] * 3)
+
+    report = ocr_harness.run_ocr_harness(b"%PDF FAKE", pipeline=default_pipeline(), workers=2)
+    assert report["aggregates"]["page_count"] == 3
+    assert all(page["baseline_text"] == "200x100" for page in report["pages"])
+    # engines are built per harness thread (at most one per worker), not per page
+    assert 1 <= len(created) <= 2
+
+
+def test_page_results_batch_rejects_out_of_sync_columns():
+    import pytest
+
+    batch = ocr_harness.PageResultsBatch.empty(2)
+    assert [row["page_index"] for row in batch.to_dicts()] == [0, 1]
+    batch.processed_text.append("stray")
+    with pytest.raises(ValueError):
+        batch.to_dicts()
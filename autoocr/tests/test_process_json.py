@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import base64
+from functools import lru_cache
 import numpy as np
 import cv2
 from fastapi.testclient import TestClient
@@ -11,13 +12,19 @@ from autoocr.api.main import app
 client = TestClient(app)
 
 
-def make_image():
-    img = 255 * np.ones((200, 300, 3), dtype=np.uint8)
+@lru_cache(maxsize=1)
+def _render() -> np.ndarray:
+    img = np.full((200, 300, 3), 255, dtype=np.uint8)
     cv2.rectangle(img, (0, 0), (299, 199), (0, 0, 0), 8)  # black border
     cv2.putText(img, "Test", (60, 110), cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0, 0, 0), 3)
+    img.flags.writeable = False
     return img
 
 
+def make_image():
+    return _render().copy()
+
+
 def test_process_json_format():
     img = make_image()
     ok, buf = cv2.imencode(".png", img)
@@ -29,35 +29,32 @@ def sample_image():
 @pytest.fixture
 def image_with_guilloche():
     """Create image with simulated guilloche pattern."""
-    img = np.ones((1000, 800, 3), dtype=np.uint8) * 255
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    gray = np.full((1000, 800), 255, dtype=np.uint8)
 
-    # Add sinusoidal pattern (simplified guilloche)
-    for i in range(0, 800, 5):
-        y = int(500 + 50 * np.sin(i * 0.1))
-        cv2.line(gray, (i, y-2), (i, y+2), 128, 1)
+    # Add sinusoidal pattern (simplified guilloche): a 5px vertical tick every 5 columns
+    xs = np.arange(0, 800, 5)
+    ys = (500 + 50 * np.sin(xs * 0.1)).astype(np.int32)
+    gray[ys[:, None] + np.arange(-2, 3), xs[:, None]] = 128
 
-    return cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
+    return np.repeat(gray[:, :, None], 3, axis=2)
 
 
 @pytest.fixture
 def image_with_watermark():
     """Create image with watermark."""
-    img = np.ones((1000, 800, 3), dtype=np.uint8) * 255
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    gray = np.full((1000, 800), 255, dtype=np.uint8)
 
     # Add watermark text
     cv2.putText(gray, "WATERMARK", (200, 500),
                 cv2.FONT_HERSHEY_SIMPLEX, 3, 200, 2)
 
-    return cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
+    return np.repeat(gray[:, :, None], 3, axis=2)
 
 
 @pytest.fixture
 def image_with_mrz():
     """Create image with MRZ-like zone at bottom."""
-    img = np.ones((1000, 800, 3), dtype=np.uint8) * 255
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    gray = np.full((1000, 800), 255, dtype=np.uint8)
 
     # Add dense text at bottom (MRZ simulation)
     mrz_y = 900
@@ -65,7 +62,7 @@ def image_with_mrz():
         cv2.putText(gray, "P<UTOERIKSSON<<ANNA<MARIA<<<<<<<<<<<<<<<<<",
                    (50, mrz_y + i*20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, 0, 1)
 
-    return cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
+    return np.repeat(gray[:, :, None], 3, axis=2)
 
 
 class TestGuillocheRemoval:
@@ -188,6 +185,23 @@ class TestSecurityDetector:
         assert isinstance(doc_type, str)
         assert doc_type in ['passport', 'id_card', 'certificate', 'standard']
 
+    def test_analyze_image_cached_by_content(self, sample_image, monkeypatch):
+        detector = SecurityFeatureDetector()
+        first = detector.analyze_image(sample_image)
+
+        calls = []
+        monkeypatch.setattr(detector, "_detect_warp", lambda gray, **kw: calls.append(1) or False)
+        first['features'].append('mutated')
+
+        again = detector.analyze_image(sample_image.copy())
+        assert calls == []
+        assert 'mutated' not in again['features']
+
+        changed = sample_image.copy()
+        changed[0, 0] = 0
+        detector.analyze_image(changed)
+        assert calls == [1]
+
 
 class TestPreprocessors:
     """Test main preprocessor classes."""
@@ -203,6 +217,13 @@ class TestPreprocessors:
         assert result['success']
         assert output_path.exists()
 
+    def test_document_preprocessor_array(self, sample_image):
+        preprocessor = DocumentPreprocessor()
+        processed, info = preprocessor.process_array(sample_image)
+
+        assert processed.shape[:2] == sample_image.shape[:2]
+        assert info['steps']
+
     def test_security_document_preprocessor(self, sample_image, tmp_path):
         input_path = tmp_path / "input.png"
         output_path = tmp_path / "output.png"
@@ -224,16 +245,27 @@ class TestPreprocessors:
         result = preprocessor.process_file(str(input_path), str(output_path))
 
         assert result['success']
+        assert 'security_features_removed' in result
         assert output_path.exists()
 
+    def test_ocr_optimized_preprocessor_array(self, image_with_guilloche):
+        preprocessor = OCROptimizedPreprocessor()
+        processed, info = preprocessor.process_array(image_with_guilloche)
+
+        assert processed.size
+        assert 'security_features_removed' in info
+
     def test_batch_processing(self, sample_image, tmp_path):
         # Create input directory with multiple images
         input_dir = tmp_path / "input"
         output_dir = tmp_path / "output"
         input_dir.mkdir()
 
+        # Identical inputs: PNG-encode once, write the bytes three times
+        ok, png = cv2.imencode(".png", sample_image)
+        assert ok
         for i in range(3):
-            cv2.imwrite(str(input_dir / f"test{i}.png"), sample_image)
+            (input_dir / f"test{i}.png").write_bytes(png.tobytes())
 
         preprocessor = DocumentPreprocessor()
         results = preprocessor.process_batch(str(input_dir), str(output_dir))
@@ -242,6 +274,24 @@ class TestPreprocessors:
         assert all(r.get('success', False) for r in results)
         assert output_dir.exists()
 
+    def test_batch_processing_parallel_matches_serial(self, sample_image, image_with_mrz, tmp_path):
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        cv2.imwrite(str(input_dir / "a.png"), sample_image)
+        cv2.imwrite(str(input_dir / "c.png"), image_with_mrz)
+        (input_dir / "b.jpg").write_bytes(b"not an image")
+
+        preprocessor = DocumentPreprocessor()
+        serial = preprocessor.process_batch(str(input_dir), str(tmp_path / "serial"), workers=1)
+        parallel = preprocessor.process_batch(str(input_dir), str(tmp_path / "parallel"), workers=2)
+
+        assert [r['file'] for r in parallel] == ['a.png', 'b.jpg', 'c.png']
+        assert [r['success'] for r in parallel] == [r['success'] for r in serial] == [True, False, True]
+        assert parallel[1]['error'] == serial[1]['error']
+        for name in ("a_processed.png", "c_processed.png"):
+            assert np.array_equal(cv2.imread(str(tmp_path / "serial" / name)),
+                                  cv2.imread(str(tmp_path / "parallel" / name)))
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])